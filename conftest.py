@@ -0,0 +1,35 @@
+"""Shared pytest configuration for the end-to-end suite."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def workspace_path():
+    """One workspace directory for the whole run, on tmpfs when available.
+
+    Every test that needs a workspace shares this directory instead of
+    paying a mkdtemp/rmtree cycle each; /dev/shm keeps the sandbox and
+    flight-recorder I/O off disk.
+    """
+    root = (
+        "/dev/shm"
+        if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+        else tempfile.gettempdir()
+    )
+    with tempfile.TemporaryDirectory(dir=root) as d:
+        yield Path(d)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _dummy_api_keys():
+    """Provide construction-only credentials so client setup never bails.
+
+    No test makes a network call: where an LLM response is needed, the
+    client is patched at the call boundary instead.
+    """
+    os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+    os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-test")
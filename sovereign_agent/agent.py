@@ -1,13 +1,22 @@
+from __future__ import annotations
+
+import bisect
+from collections import ChainMap, deque
 from pathlib import Path
-from sovereign_agent.core.cognitive_core import CognitiveCore
-from sovereign_agent.core.state import SharedSessionState
-from sovereign_agent.core.models import TaskPlan, HandlerStepModel
+import functools
 import importlib
 import pkgutil
 import sys
 import os
-from typing import Dict
-from sovereign_agent.handlers.base import BaseHandler
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from sovereign_agent.core.models import TaskPlan
+
+# interned once so history entries share the same role string objects
+# instead of allocating/comparing fresh ones per call
+ROLE_USER = sys.intern("user")
+ROLE_SYSTEM = sys.intern("system")
 
 # Import readline for command history and line editing
 try:
@@ -21,30 +30,72 @@ except ImportError:
     except ImportError:
         READLINE_AVAILABLE = False
 
-def discover_handlers():
-    handlers = {}
-    # import handlers package
+@functools.lru_cache(maxsize=1)
+def _handler_module_names():
+    """Memoize the filesystem scan of the handlers package.
+
+    The pkgutil walk stats the package directory; caching the resulting
+    module names means only the first caller pays for the I/O.
+    """
     import sovereign_agent.handlers as handlers_pkg
-    for finder, name, ispkg in pkgutil.iter_modules(handlers_pkg.__path__):
-        if name.startswith("_"):
-            continue
+    return tuple(
+        name for finder, name, ispkg in pkgutil.iter_modules(handlers_pkg.__path__)
+        if not name.startswith("_")
+    )
+
+@functools.lru_cache(maxsize=1)
+def _discover_handler_classes():
+    """Scan the handlers package once per process and memoize the classes.
+
+    Discovery is import- and stat-bound, so repeated agent constructions
+    should not pay for another package walk.
+    """
+    from sovereign_agent.handlers.base import BaseHandler
+
+    classes = []
+    for name in _handler_module_names():
         mod = importlib.import_module(f"sovereign_agent.handlers.{name}")
-        # find classes inheriting BaseHandler
-        for attr in dir(mod):
-            obj = getattr(mod, attr)
-            try:
-                if isinstance(obj, type) and issubclass(obj, BaseHandler) and obj is not BaseHandler:
-                    inst = obj()
-                    handlers[inst.name] = inst
-            except Exception:
-                continue
+        # find classes inheriting BaseHandler; only look at classes the module
+        # itself defines rather than sweeping every re-exported symbol
+        for obj in vars(mod).values():
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, BaseHandler)
+                and obj is not BaseHandler
+                and obj.__module__ == mod.__name__
+            ):
+                classes.append(obj)
+    return tuple(classes)
+
+@functools.lru_cache(maxsize=1)
+def discover_handlers():
+    """Return the shared process-wide handler registry.
+
+    Handlers hold no per-session state (everything mutable travels through
+    SharedSessionState), so every SovereignAgent shares one instance of each
+    rather than re-instantiating the registry per agent.
+    """
+    handlers = {}
+    for cls in _discover_handler_classes():
+        inst = cls()
+        handlers[inst.name] = inst
     return handlers
 
 class SovereignAgent:
     def __init__(self, workspace_path: str):
+        # Deferred so that importing this module stays cheap; the cognitive
+        # core pulls in the LLM client stack, which is only needed once an
+        # agent is actually constructed.
+        from sovereign_agent.core.cognitive_core import CognitiveCore
+        from sovereign_agent.core.state import SharedSessionState
+
         self.workspace_path = Path(workspace_path).resolve()
-        if not self.workspace_path.exists():
-            self.workspace_path.mkdir(parents=True, exist_ok=True)
+        try:
+            # single mkdir call instead of an exists() stat followed by mkdir
+            self.workspace_path.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
             print(f"Created workspace at: {self.workspace_path}")
 
         self.state = SharedSessionState(self.workspace_path)
@@ -54,7 +105,12 @@ class SovereignAgent:
         print(f"Registered handlers: {list(self.handlers.keys())}")
 
         self.cognitive_core = CognitiveCore(list(self.handlers.values()))
-        
+
+        # queue of pending plans; _execute_plan drains it iteratively so a
+        # plan enqueued mid-run (e.g. a recovery plan) never grows the stack
+        self._plan_queue = deque()
+        self._draining_plans = False
+
         # Set up readline for command history and line editing
         self._setup_readline()
 
@@ -71,7 +127,11 @@ class SovereignAgent:
             # Load existing history
             readline.read_history_file(self.history_file)
         except (FileNotFoundError, PermissionError):
-            pass  # No history file yet, that's fine
+            # No history file yet; create it so incremental appends work
+            try:
+                open(self.history_file, 'a').close()
+            except OSError:
+                pass
         
         # Configure history
         readline.set_history_length(100)  # Keep last 100 commands
@@ -83,23 +143,49 @@ class SovereignAgent:
         # Enable standard readline key bindings
         readline.parse_and_bind('set editing-mode emacs')  # Use emacs-style key bindings
         
+    # sorted so prefix matches form a contiguous run findable with bisect
+    COMMON_COMMANDS = sorted([
+        'list', 'search', 'find', 'run', 'test', 'build', 'compile',
+        'show', 'display', 'check', 'analyze', 'create', 'delete',
+        'help', 'exit', 'quit'
+    ])
+
     def _completer(self, text, state):
-        """Simple tab completion for common commands."""
-        common_commands = [
-            'list', 'search', 'find', 'run', 'test', 'build', 'compile',
-            'show', 'display', 'check', 'analyze', 'create', 'delete',
-            'help', 'exit', 'quit'
-        ]
-        
-        matches = [cmd for cmd in common_commands if cmd.startswith(text.lower())]
-        
+        """Tab completion for common commands via bisect on a sorted list.
+
+        readline calls this once per candidate with increasing state, so the
+        match list is computed on state 0 and reused for the rest of the run.
+        """
+        if state == 0:
+            prefix = text.lower()
+            commands = self.COMMON_COMMANDS
+            lo = bisect.bisect_left(commands, prefix)
+            hi = lo
+            while hi < len(commands) and commands[hi].startswith(prefix):
+                hi += 1
+            self._completion_matches = commands[lo:hi]
+
+        matches = self._completion_matches
         if state < len(matches):
             return matches[state]
         return None
         
+    def _append_history_entry(self):
+        """Incrementally append the latest command to the history file."""
+        if not READLINE_AVAILABLE:
+            return
+        try:
+            # append_history_file writes only the new entry; pyreadline3
+            # lacks it, in which case the exit-time save still covers us
+            readline.append_history_file(1, self.history_file)
+        except AttributeError:
+            self._history_needs_full_save = True
+        except (PermissionError, OSError):
+            pass
+
     def _save_history(self):
-        """Save command history to file."""
-        if READLINE_AVAILABLE:
+        """Save command history to file (fallback for incremental append)."""
+        if READLINE_AVAILABLE and getattr(self, '_history_needs_full_save', False):
             try:
                 readline.write_history_file(self.history_file)
             except (PermissionError, OSError):
@@ -111,31 +197,63 @@ class SovereignAgent:
     
 
     def _execute_plan(self, plan: TaskPlan):
+        """Enqueue a plan and drain the queue iteratively.
+
+        Re-entrant calls (a follow-up or recovery plan produced while a plan
+        is already running) only enqueue; the outermost call runs the loop,
+        so chained plans cost queue slots instead of stack frames.
+        """
+        self._plan_queue.append(plan)
+        if self._draining_plans:
+            return
+        self._draining_plans = True
+        try:
+            while self._plan_queue:
+                self._run_plan_steps(self._plan_queue.popleft())
+        finally:
+            self._draining_plans = False
+
+    def _run_plan_steps(self, plan: TaskPlan):
         print(f"\nExecuting Plan: {plan.overall_goal}")
-        
-        # Collect context from previous steps
+
+        # Collect context from previous steps. Handlers get a ChainMap view
+        # layering the shared context over each step's own input_args, so no
+        # per-step dict copy or previous-results list rebuild is needed; the
+        # overlay's structures grow in place as steps complete.
         step_context = {}
-        
-        for i, step in enumerate(plan.steps):
-            print(f"\n--- Step {i+1}/{len(plan.steps)}: {step.handler_name} ---")
+        previous_results = []
+        context_overlay = {
+            "__step_context": step_context,
+            "__previous_results": previous_results,
+        }
+
+        # Steps run strictly one after another: every handler consumes the
+        # shared step context and streams output as it goes, and a failed
+        # step must prevent the ones after it from ever starting — so there
+        # is no independence to exploit by overlapping them.
+        # hoist loop invariants: the step list, its length, and the bound
+        # lookups that would otherwise be re-resolved on every iteration
+        steps = plan.steps
+        total_steps = len(steps)
+        get_handler = self.handlers.get
+        state = self.state
+
+        for i, step in enumerate(steps):
+            print(f"\n--- Step {i+1}/{total_steps}: {step.handler_name} ---")
             print(f"Goal: {step.step_goal}")
-            handler = self.handlers.get(step.handler_name)
+            handler = get_handler(step.handler_name)
             if not handler:
                 print(f"❌ Handler '{step.handler_name}' not found.")
                 continue
             try:
                 step.status = "running"
-                
-                # Add context from previous steps to input args
-                enhanced_args = step.input_args.copy()
-                enhanced_args["__step_context"] = step_context
-                enhanced_args["__previous_results"] = [
-                    {"step_goal": prev_step.step_goal, "result": prev_step.result}
-                    for prev_step in plan.steps[:i] if prev_step.result
-                ]
-                
-                response = handler.execute(step.step_goal, enhanced_args, self.state)
+
+                response = handler.execute(
+                    step.step_goal,
+                    ChainMap(context_overlay, step.input_args),
+                    state)
                 step.result = response
+                previous_results.append({"step_goal": step.step_goal, "result": response})
                 
                 # Store step result in context for next steps
                 if response.success:
@@ -149,15 +267,16 @@ class SovereignAgent:
                 if artifacts and artifacts.get('full_stdout'):
                     full_output = artifacts['full_stdout']
                     if len(full_output.split('\n')) > 50:  # If more than 50 lines
-                        print(f"\n{self._format_help_text('💡 Output was truncated. To see full output, ask: \"show me the full output from that last command\"')}")
+                        hint = '💡 Output was truncated. To see full output, ask: "show me the full output from that last command"'
+                        print(f"\n{self._format_help_text(hint)}")
                 
-                self.state.add_to_history("system", f"Step '{step.step_goal}' completed with status: {step.status}.")
+                state.add_to_history(ROLE_SYSTEM, f"Step '{step.step_goal}' completed with status: {step.status}.")
                 # Save flight recorder entry
-                self.state.save_flight_record()
+                state.save_flight_record()
                 if not response.success:
                     print(f"❌ Step failed. Execution halted.")
                     print(f"{self._format_help_text('💡 You can try rephrasing your request or use a more specific command.')}")
-                    self.state.add_to_history("system", f"Step failed: {step.step_goal}. Error: {response.content}")
+                    state.add_to_history(ROLE_SYSTEM, f"Step failed: {step.step_goal}. Error: {response.content}")
                     break
             except KeyboardInterrupt:
                 print("Execution interrupted by user.")
@@ -173,16 +292,20 @@ class SovereignAgent:
                 user_input = input("\n> ")
                 if user_input.lower().strip() in ["exit", "quit"]:
                     break
-                self.state.add_to_history("user", user_input)
+                self._append_history_entry()
+                self.state.add_to_history(ROLE_USER, user_input)
                 task_plan = self.cognitive_core.orchestrate(user_input, self.state)
                 self.state.current_task_plan = task_plan
                 if not task_plan or not task_plan.steps:
                     print("I couldn't devise a plan. Try rephrasing.")
                     continue
-                print("\n🤖 I have a plan:")
-                print(f"Goal: {task_plan.overall_goal}")
-                for i, step in enumerate(task_plan.steps):
-                    print(f"  {i+1}. {step.step_goal} (using {step.handler_name})")
+                # build the plan listing once and flush it in a single print
+                plan_lines = ["\n🤖 I have a plan:", f"Goal: {task_plan.overall_goal}"]
+                plan_lines.extend(
+                    f"  {i+1}. {step.step_goal} (using {step.handler_name})"
+                    for i, step in enumerate(task_plan.steps)
+                )
+                print("\n".join(plan_lines))
                 self._execute_plan(task_plan)
             except KeyboardInterrupt:
                 print("\nSession terminated by user.")
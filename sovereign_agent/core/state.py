@@ -1,55 +1,114 @@
+import itertools
 import json
+import os
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from sovereign_agent.core.models import TaskPlan
 
 class DynamicWorkspaceContext:
+    # mirrors the dependency exclusions the planner prompt already uses;
+    # scanning these adds noise and dominates walk time on real repos
+    EXCLUDED_DIRS = frozenset({
+        '.git', '.svn', '.hg', 'venv', '.venv', '__pycache__',
+        '.pytest_cache', '.mypy_cache', 'site-packages', 'node_modules',
+        '.npm', '.yarn', '.tox', '.cache', 'dist', 'build',
+    })
+    # the prompt only shows a handful of files; no need to hold more
+    MAX_FILES = 500
+
     def __init__(self, workspace_path: Path):
         self.path = Path(workspace_path)
-        self.file_tree = {}
-        self.analyze()
+        # built lazily on first file_tree access, not at construction time
+        self._file_tree = None
+        # bumped on every analyze() so consumers can cache derived views
+        # (summary strings, prompt sections) per workspace version
+        self.version = 0
+
+    @property
+    def file_tree(self):
+        if self._file_tree is None:
+            self.analyze()
+        return self._file_tree
 
     def analyze(self):
+        # iterative os.scandir walk: one syscall batch per directory and
+        # the entry type comes back without an extra stat per file
         files = []
-        try:
-            for p in self.path.rglob('*'):
-                if p.is_file():
-                    files.append(str(p.relative_to(self.path)))
-        except Exception:
-            pass
-        self.file_tree = {'files': files}
+        root = str(self.path)
+        stack = [root]
+        while stack and len(files) < self.MAX_FILES:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.EXCLUDED_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(os.path.relpath(entry.path, root))
+                            if len(files) >= self.MAX_FILES:
+                                break
+            except OSError:
+                continue
+        self._file_tree = {'files': files}
+        self.version += 1
 
     def to_json(self):
-        return {'path': str(self.path), 'file_tree_summary': self.file_tree}
+        return {'path': str(self.path), 'version': self.version, 'file_tree_summary': self.file_tree}
 
 class SharedSessionState:
+    # oldest turns beyond this are dropped; prompts only ever use the tail
+    MAX_HISTORY = 1000
+
     def __init__(self, workspace_path: Path):
         self.workspace_context = DynamicWorkspaceContext(workspace_path)
-        self.conversation_history: List[Dict[str, str]] = []
+        # bounded deque: appends stay O(1) forever and tail reads via
+        # recent() are O(k) instead of copying/slicing a growing list
+        self.conversation_history: deque = deque(maxlen=self.MAX_HISTORY)
+        # total turns ever added; survives deque eviction so flight-record
+        # deltas know how many entries are new since the last record
+        self._turns_total = 0
         self.current_task_plan: Optional[TaskPlan] = None
         self.artifacts: Dict[str, Any] = {}
-        # flight recorder file
-        self.flight_path = Path(workspace_path) / '.sovereign_flight.json'
-        self._flight = {'records': []}
+        # flight recorder file (JSON lines, one record per entry)
+        self.flight_path = Path(workspace_path) / '.sovereign_flight.jsonl'
+        # delta tracking: conversation entries already recorded, and
+        # artifact keys touched since the last record
+        self._flight_cursor = 0
+        self._dirty_artifacts: set = set()
         self.save_flight_record()  # initialize
 
     def add_to_history(self, role: str, content: str):
         self.conversation_history.append({'role': role, 'content': content})
+        self._turns_total += 1
+
+    def recent(self, k: int) -> List[Dict[str, str]]:
+        """Return the last k conversation entries as a list, O(k)."""
+        history = self.conversation_history
+        if k >= len(history):
+            return list(history)
+        return list(itertools.islice(history, len(history) - k, len(history)))
 
     def update_artifact(self, key: str, value: Any):
         self.artifacts[key] = value
-    
+        self._dirty_artifacts.add(key)
+
 
     def save_flight_record(self):
-        # append current snapshot
-        snapshot = {
-            'conversation': list(self.conversation_history),
-            'artifacts': dict(self.artifacts),
+        # append only what changed since the last record; replaying the
+        # file reconstructs the full session, and each record stays O(delta)
+        # instead of re-serializing the whole history every call
+        record = {
+            'conversation': self.recent(self._turns_total - self._flight_cursor),
+            'artifacts': {k: self.artifacts[k] for k in self._dirty_artifacts if k in self.artifacts},
         }
-        self._flight['records'].append(snapshot)
         try:
             self.flight_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.flight_path, 'w') as f:
-                json.dump(self._flight, f, indent=2)
+            with open(self.flight_path, 'a') as f:
+                f.write(json.dumps(record))
+                f.write('\n')
         except Exception:
-            pass
+            return
+        self._flight_cursor = self._turns_total
+        self._dirty_artifacts.clear()
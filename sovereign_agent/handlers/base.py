@@ -6,10 +6,14 @@ class BaseHandler(ABC):
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
+        # capabilities never change after construction, so the dict is
+        # built once and handed out by reference; callers treat it as
+        # read-only (the planner serializes it straight to JSON)
+        self._capabilities = {'name': name, 'description': description}
 
     @abstractmethod
     def execute(self, step_goal: str, args: dict, state: SharedSessionState) -> AgentResponse:
         pass
 
     def get_capabilities(self) -> dict:
-        return {'name': self.name, 'description': self.description}
+        return self._capabilities
@@ -1,30 +1,197 @@
+import functools
+import shlex
 import shutil
 import tempfile
 import subprocess
+import threading
 import os
 import re
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: no reflink support, plain copies below
+    fcntl = None
 from sovereign_agent.handlers.base import BaseHandler
 from sovereign_agent.core.models import AgentResponse
 from sovereign_agent.core.state import SharedSessionState
 from sovereign_agent.utils.output_formatter import OutputFormatter
 from pathlib import Path
 
-# simple dangerous command pattern matcher
-DANGEROUS_PATTERNS = [
-    r'(^|\s)rm\s+-rf', r'(^|\s)dd\s+', r'(^|\s)mkfs', r'(^|\s)chmod\s+\d{3}\s+/', r'(^|\s)shutdown\b', r'(^|\s)reboot\b'
-]
-DANGEROUS_RE = re.compile('|'.join(DANGEROUS_PATTERNS), re.IGNORECASE)
+# simple dangerous command pattern matcher: one anchored alternation with
+# non-capturing groups, so the engine checks the (^|\s) boundary once per
+# position instead of backtracking through it per alternative
+DANGEROUS_RE = re.compile(
+    r'(?:^|\s)(?:rm\s+-rf|dd\s+|mkfs|chmod\s+\d{3}\s+/|shutdown\b|reboot\b)',
+    re.IGNORECASE)
+
+
+# tools the planner emits constantly and that are safe to exec directly
+ARGV_COMMANDS = frozenset({
+    'grep', 'find', 'awk', 'ls', 'cat', 'wc', 'head', 'tail', 'python', 'git', 'pwd',
+})
+# subset of ARGV_COMMANDS that only ever read the workspace; these run
+# in place, no sandbox materialization needed at all
+READ_ONLY_COMMANDS = frozenset({
+    'grep', 'find', 'awk', 'cat', 'ls', 'wc', 'head', 'tail', 'pwd',
+})
+# the only find predicates allowed on the read-only fast path; anything
+# unlisted (e.g. -delete, -exec, -fprintf) fails closed into the sandbox,
+# so a write-capable predicate we haven't thought of can't escape
+_FIND_READ_ONLY_ACTIONS = frozenset({
+    '-H', '-L', '-P', '-a', '-and', '-depth', '-empty', '-false', '-follow',
+    '-group', '-iname', '-ipath', '-iregex', '-links', '-ls',
+    '-maxdepth', '-mindepth', '-mmin', '-mtime', '-name', '-newer', '-not',
+    '-o', '-or', '-path', '-perm', '-print', '-print0', '-printf', '-prune',
+    '-regex', '-size', '-true', '-type', '-user', '-xdev',
+})
+# any of these means the command needs real shell semantics (pipes,
+# redirects, substitution, globbing) and must keep the sh -c hop
+SHELL_META_RE = re.compile(r'[|&;<>()$`*?\[\]{}~\\]')
+
+
+def _is_read_only(argv) -> bool:
+    """True when an argv-style command can only read the workspace."""
+    if argv[0] not in READ_ONLY_COMMANDS:
+        return False
+    if argv[0] == 'find':
+        # allowlist, not denylist: every dash-prefixed token must be a
+        # known read-only predicate (non-dash tokens are paths/arguments,
+        # and a dash-digit token like '-1' is a numeric predicate value)
+        for arg in argv[1:]:
+            if (arg.startswith('-') and arg not in _FIND_READ_ONLY_ACTIONS
+                    and not (len(arg) > 1 and arg[1].isdigit())):
+                return False
+    return True
+
+
+def _as_argv(command: str):
+    """Return an argv list for commands that don't need a shell, else None.
+
+    Simple grep/find/ls invocations make up most planner output; running
+    them argv-style skips the fork of /bin/sh per command. Anything with
+    shell metacharacters, parse errors, or an unlisted program falls back
+    to shell=True.
+    """
+    if SHELL_META_RE.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if argv and argv[0] in ARGV_COMMANDS:
+        return argv
+    return None
+
+
+# FICLONE asks the filesystem for a copy-on-write clone of the data
+# blocks (btrfs/xfs): sandbox setup stays metadata-speed, but unlike a
+# hardlink the sandbox file is its own inode, so in-place writes there
+# can never touch the real workspace
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: str, dest: str):
+    """Reflink src to dest where the filesystem supports it, else copy."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dest)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
+
+
+@functools.lru_cache(maxsize=512)
+def _is_safe_command(command: str) -> bool:
+    """Pure safety check, memoized: agents re-issue the same commands a lot."""
+    if not command or not command.strip():
+        return False
+    return DANGEROUS_RE.search(command) is None
 
 class ToolingHandler(BaseHandler):
+    # how many stdout lines to echo live while the command is still running
+    LIVE_ECHO_LINES = 20
+    COMMAND_TIMEOUT = 30
+
     def __init__(self):
         super().__init__(name='ToolingHandler', description='Executes shell commands in an ephemeral sandbox copy of the workspace')
 
     def _is_safe(self, command: str) -> bool:
-        if not command or not command.strip():
-            return False
-        if DANGEROUS_RE.search(command):
-            return False
-        return True
+        return _is_safe_command(command)
+
+    def _materialize_sandbox(self, src: Path, tmpdir: Path):
+        """Populate the ephemeral sandbox from the workspace.
+
+        Files are reflinked into the sandbox where the filesystem allows
+        it — a copy-on-write clone per file instead of a data copy, so
+        setup cost stays flat as the repo grows while keeping the sandbox
+        fully isolated (a hardlink would share the workspace inode and
+        let sandbox writes clobber real files). Unsupported filesystems
+        fall back to copy2 per file. Flight recorder files are skipped to
+        avoid growth. The walk uses os.scandir, which gets entry types from
+        the directory read itself instead of a stat and a Path object per
+        entry the way rglob does.
+        """
+        stack = [(str(src), str(tmpdir))]
+        while stack:
+            cur_src, cur_dest = stack.pop()
+            try:
+                entries = os.scandir(cur_src)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    dest = os.path.join(cur_dest, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        os.makedirs(dest, exist_ok=True)
+                        stack.append((entry.path, dest))
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name.startswith('.sovereign_flight'):
+                            continue
+                        _clone_or_copy(entry.path, dest)
+
+    def _run_streaming(self, command, cwd, executable):
+        """Run a command, echoing stdout lines as they arrive.
+
+        Accepts either an argv list (exec'd directly, no shell hop) or a
+        command string (run through the shell). The first LIVE_ECHO_LINES
+        of stdout are printed while the command is still running instead of
+        the user waiting for the whole buffer; everything is still collected
+        for the AgentResponse. stderr is drained on a helper thread so
+        neither pipe can fill up and stall the child.
+        Returns (stdout, stderr, exit_code, timed_out).
+        """
+        proc = subprocess.Popen(
+            command, shell=isinstance(command, str), executable=executable, cwd=cwd,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+        timed_out = [False]
+
+        def _kill():
+            timed_out[0] = True
+            proc.kill()
+
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))
+        stderr_reader.daemon = True
+        stderr_reader.start()
+
+        watchdog = threading.Timer(self.COMMAND_TIMEOUT, _kill)
+        watchdog.start()
+        stdout_lines = []
+        try:
+            for line in proc.stdout:
+                stdout_lines.append(line)
+                if len(stdout_lines) <= self.LIVE_ECHO_LINES:
+                    print(f"  {line.rstrip()}")
+            proc.wait()
+            stderr_reader.join(timeout=5)
+        finally:
+            watchdog.cancel()
+
+        return ''.join(stdout_lines), ''.join(stderr_chunks), proc.returncode, timed_out[0]
 
     def execute(self, step_goal: str, args: dict, state: SharedSessionState):
         command = args.get('command')
@@ -41,31 +208,30 @@ class ToolingHandler(BaseHandler):
         if not self._is_safe(command):
             return AgentResponse(success=False, content=f'Command appears dangerous or disallowed: {command}', status_update='dangerous-command')
 
-        # create ephemeral copy of workspace
         src = Path(state.workspace_context.path)
-        tmpdir = Path(tempfile.mkdtemp(prefix='sovereign_sandbox_'))
+        # simple tool invocations exec directly without a shell; the
+        # rest run via the shell, with bash for advanced features like
+        # process substitution, arrays, etc.
+        argv = _as_argv(command)
+        if argv is not None and _is_read_only(argv):
+            # read-only inspection commands (the bulk of planner output)
+            # run straight in the workspace; no sandbox to materialize
+            workdir = src
+        else:
+            # create ephemeral copy of workspace
+            workdir = Path(tempfile.mkdtemp(prefix='sovereign_sandbox_'))
         try:
-            # copy files (excluding .sovereign_flight.json to avoid growth)
-            for p in src.rglob('*'):
-                rel = p.relative_to(src)
-                dest = tmpdir / rel
-                if p.is_dir():
-                    dest.mkdir(parents=True, exist_ok=True)
-                else:
-                    # ensure parent exists
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    if p.name == '.sovereign_flight.json':
-                        continue
-                    shutil.copy2(p, dest)
-            # execute command in tmpdir using bash for advanced features
-            # Use bash explicitly for commands that might need process substitution, arrays, etc.
-            if any(feature in command for feature in ['<(', '>(', '${', '[[', 'declare', 'local']):
-                result = subprocess.run(command, shell=True, executable='/bin/bash', capture_output=True, text=True, cwd=tmpdir, timeout=30)
+            if workdir is not src:
+                self._materialize_sandbox(src, workdir)
+            if argv is not None:
+                runnable, executable = argv, None
+            elif any(feature in command for feature in ['<(', '>(', '${', '[[', 'declare', 'local']):
+                runnable, executable = command, '/bin/bash'
             else:
-                result = subprocess.run(command, shell=True, capture_output=True, text=True, cwd=tmpdir, timeout=30)
-            stdout = result.stdout or ''
-            stderr = result.stderr or ''
-            exit_code = result.returncode
+                runnable, executable = command, None
+            stdout, stderr, exit_code, timed_out = self._run_streaming(runnable, workdir, executable)
+            if timed_out:
+                return AgentResponse(success=False, content='Command timed out.', status_update='timeout')
             
             # Format output using OutputFormatter for clean display
             formatted_content = OutputFormatter.format_command_result(command, exit_code, stdout, stderr)
@@ -84,7 +250,7 @@ class ToolingHandler(BaseHandler):
                 content=formatted_content, 
                 status_update='completed' if is_success else 'failed', 
                 artifacts_created={
-                    'sandbox_path': str(tmpdir), 
+                    'sandbox_path': str(workdir),
                     'exit_code': exit_code, 
                     'has_stderr': bool(stderr.strip()),
                     'full_stdout': stdout,
@@ -92,7 +258,5 @@ class ToolingHandler(BaseHandler):
                     'command': command
                 }
             )
-        except subprocess.TimeoutExpired:
-            return AgentResponse(success=False, content='Command timed out.', status_update='timeout')
         except Exception as e:
             return AgentResponse(success=False, content=f'Exception during execution: {e}', status_update='error')
\ No newline at end of file
@@ -1,93 +1,256 @@
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+import random
+import threading
 import time
 import os
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, ValidationError
 from openai import OpenAI
 import anthropic
 from dotenv import load_dotenv
 
+from sovereign_agent.utils import jsonio
+
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-class LLMResponse(BaseModel):
+# reusable decoder for pulling the first JSON object out of a mixed response
+_JSON_DECODER = json.JSONDecoder()
+
+# one SDK client (and so one persistent HTTP connection pool) per
+# (provider, api_key); every LLMClient for that provider shares it, so
+# TCP/TLS setup is paid once per process instead of per client
+_SDK_CLIENT_CACHE: Dict[tuple, Any] = {}
+
+
+def _shared_sdk_client(provider: str, api_key: str):
+    key = (provider, api_key)
+    client = _SDK_CLIENT_CACHE.get(key)
+    if client is None:
+        if provider == "openai":
+            client = OpenAI(api_key=api_key)
+        else:
+            client = anthropic.Anthropic(api_key=api_key)
+        _SDK_CLIENT_CACHE[key] = client
+    return client
+
+# built on every API call (and once per retry), so it skips pydantic
+# validation: the fields are filled by our own code, not parsed input
+@dataclass(slots=True)
+class LLMResponse:
     content: str
     success: bool
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     truncated: bool = False
     error: Optional[str] = None
 
+class RateLimiter:
+    """Token-bucket limiter that paces requests just under provider quota.
+
+    Spending a few milliseconds waiting client-side is cheaper than
+    burning a round-trip on a 429 plus its backoff. Buckets refill
+    continuously from time.monotonic(); acquire blocks until both a
+    request slot and the estimated tokens are available. Thread-safe so
+    call_many workers can share one limiter.
+    """
+
+    def __init__(self, rpm: int = 60, tpm: int = 90000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, est_tokens: int):
+        # a request estimated above the per-minute quota can never be
+        # satisfied by the bucket (tokens cap at tpm), so clamp it: the
+        # call drains the full bucket and the provider has the final say
+        est_tokens = min(est_tokens, self.tpm)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last
+                self._last = now
+                self._requests = min(float(self.rpm), self._requests + elapsed * (self.rpm / 60.0))
+                self._tokens = min(float(self.tpm), self._tokens + elapsed * (self.tpm / 60.0))
+                if self._requests >= 1.0 and self._tokens >= est_tokens:
+                    self._requests -= 1.0
+                    self._tokens -= est_tokens
+                    return
+                need_requests = max(0.0, (1.0 - self._requests) / (self.rpm / 60.0))
+                need_tokens = max(0.0, (est_tokens - self._tokens) / (self.tpm / 60.0))
+                wait = max(need_requests, need_tokens)
+            time.sleep(wait)
+
+
+# one limiter per (provider, model): quota is per model, and every client
+# talking to the same model must draw from the same bucket
+_RATE_LIMITER_CACHE: Dict[tuple, RateLimiter] = {}
+
+
+def _shared_rate_limiter(provider: str, model: str) -> RateLimiter:
+    key = (provider, model)
+    limiter = _RATE_LIMITER_CACHE.get(key)
+    if limiter is None:
+        limiter = _RATE_LIMITER_CACHE.setdefault(key, RateLimiter())
+    return limiter
+
+
 class LLMClient:
     """Multi-provider LLM client with retry logic and validation."""
-    
+
+    # bound on remembered (system, user) -> response entries, evicted LRU-style
+    RESPONSE_CACHE_MAX = 256
+    # ceiling on exponential backoff between retries
+    MAX_RETRY_DELAY = 30.0
+
     def __init__(
         self, 
         provider: Literal["openai", "anthropic"], 
         model: str,
         api_key: Optional[str] = None,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        stream: bool = False
     ):
         if not provider or not model:
             raise ValueError("Provider and model must be specified")
-        
+
         self.provider = provider
         self.model = model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # opt-in: accumulate the completion as it streams instead of
+        # waiting for the full body before the first byte is processed
+        self.stream = stream
         
-        # Initialize client
+        # Initialize client (shared per provider/key so the underlying
+        # HTTP connection pool is reused across LLMClient instances)
         if provider == "openai":
             api_key = api_key or os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OpenAI API key required")
-            self.client = OpenAI(api_key=api_key)
-            
+            self.client = _shared_sdk_client(provider, api_key)
+
         elif provider == "anthropic":
-            api_key = api_key or os.getenv("ANTHROPIC_API_KEY")  
+            api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("Anthropic API key required")
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client = _shared_sdk_client(provider, api_key)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
+        # decided once at construction so callers can dispatch straight to
+        # the right structured-output path instead of probing per call
+        self.supports_function_calling = provider == "openai"
+
+        # exact-match response cache: identical prompts at temperature 0
+        # are deterministic enough to reuse, and tool-calling workloads
+        # repeat prompts a lot. Keys are sha256 digests so the cache
+        # doesn't pin full prompt strings in memory.
+        self._response_cache: OrderedDict = OrderedDict()
+        # call_many workers share this cache; the lock keeps the
+        # get/move_to_end hit path and insert/evict store path atomic
+        self._cache_lock = threading.Lock()
+
+        # shared per (provider, model): pre-empts 429s instead of
+        # reacting to them with retries
+        self.limiter = _shared_rate_limiter(provider, model)
+
+        # serialized schemas keyed by object identity; callers pass the
+        # same few schema dicts over and over. Holding the schema in the
+        # entry keeps its id stable for the cache's lifetime.
+        self._schema_dump_cache: Dict[int, tuple] = {}
+
+    def _schema_json_for(self, schema: Dict[str, Any]) -> str:
+        key = id(schema)
+        entry = self._schema_dump_cache.get(key)
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+        text = jsonio.dumps(schema)
+        self._schema_dump_cache[key] = (schema, text)
+        return text
+
+    def _response_cache_key(self, system_prompt: str, user_prompt: str) -> bytes:
+        h = hashlib.sha256()
+        h.update(f"{self.provider}|{self.model}|".encode())
+        h.update(system_prompt.encode())
+        h.update(b"\x00")
+        h.update(user_prompt.encode())
+        return h.digest()
+
+    def _retry_delay(self, attempt: int, exc: Optional[Exception] = None) -> float:
+        """Backoff before the next retry: exponential with jitter.
+
+        A server-provided Retry-After (both providers send one on 429s)
+        takes precedence, so we wait exactly as long as the quota window
+        asks instead of guessing. The jitter spreads concurrent retries
+        out rather than having them land in the same instant.
+        """
+        headers = getattr(getattr(exc, 'response', None), 'headers', None)
+        if headers is not None:
+            raw = headers.get('retry-after-ms')
+            if raw:
+                try:
+                    return float(raw) / 1000.0
+                except ValueError:
+                    pass
+            raw = headers.get('retry-after')
+            if raw:
+                try:
+                    return float(raw)
+                except ValueError:
+                    pass
+        delay = min(self.MAX_RETRY_DELAY, self.retry_delay * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.5)
+
+    # pre-lowered once; _is_truncated_response scans these per response
+    _TRUNCATION_INDICATORS = (
+        "i apologize, but it seems my response was cut off",
+        "due to length limitations",
+        "the response was truncated",
+        "...",  # Common truncation indicator
+    )
+
     def _is_truncated_response(self, content: str) -> bool:
         """Detect if response appears truncated."""
         if not content or len(content.strip()) < 10:
             return True
-            
-        truncation_indicators = [
-            "I apologize, but it seems my response was cut off",
-            "Due to length limitations",
-            "The response was truncated",
-            "...",  # Common truncation indicator
-        ]
-        
+
         content_lower = content.lower()
-        for indicator in truncation_indicators:
-            if indicator.lower() in content_lower:
-                return True
-                
-        return False
+        return any(indicator in content_lower for indicator in self._TRUNCATION_INDICATORS)
+
+    def _validate_response(self, content: str) -> tuple[bool, Optional[str], bool]:
+        """Validate response completeness and quality.
 
-    def _validate_response(self, content: str) -> tuple[bool, Optional[str]]:
-        """Validate response completeness and quality."""
+        Returns (is_valid, error, truncated) in one pass so callers don't
+        re-run the truncation scan on the same content.
+        """
         if not content or not content.strip():
-            return False, "Empty response"
-            
+            return False, "Empty response", True
+
         if self._is_truncated_response(content):
-            return False, "Response appears truncated"
-            
+            return False, "Response appears truncated", True
+
         if len(content.strip()) < 5:
-            return False, "Response too short"
-            
-        return True, None
+            return False, "Response too short", False
+
+        return True, None, False
 
     def _make_api_call(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         """Make actual API call to provider."""
+        # rough ~4 chars/token estimate is plenty for pacing purposes
+        self.limiter.acquire(len(system_prompt) // 4 + len(user_prompt) // 4)
         try:
             if self.provider == "openai":
                 response = self.client.chat.completions.create(
@@ -108,7 +271,14 @@ class LLMClient:
                 response = self.client.messages.create(
                     model=self.model,
                     max_tokens=4096,
-                    system=system_prompt,
+                    # cache_control lets Anthropic reuse the (large, static)
+                    # system prompt across calls instead of re-processing it;
+                    # OpenAI applies prefix caching automatically.
+                    system=[{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }],
                     messages=[{"role": "user", "content": user_prompt}],
                     temperature=0.0
                 )
@@ -121,14 +291,14 @@ class LLMClient:
                     "stop_reason": response.stop_reason
                 }
             
-            # Validate response
-            is_valid, error = self._validate_response(content)
-            
+            # Validate response (one scan yields validity and truncation)
+            is_valid, error, truncated = self._validate_response(content or "")
+
             return LLMResponse(
                 content=content or "",
                 success=is_valid,
                 metadata=metadata,
-                truncated=self._is_truncated_response(content or ""),
+                truncated=truncated,
                 error=error
             )
             
@@ -140,6 +310,84 @@ class LLMClient:
                 error=str(e)
             )
 
+    def _make_api_call_streaming(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        """Streamed variant of _make_api_call.
+
+        Chunks are collected in a list and joined once (no quadratic
+        string concatenation), so the first tokens are in hand while the
+        tail is still arriving and truncation shows up as soon as the
+        stream closes rather than after a full-body wait.
+        """
+        self.limiter.acquire(len(system_prompt) // 4 + len(user_prompt) // 4)
+        try:
+            chunks = []
+            if self.provider == "openai":
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.0,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                finish_reason = None
+                usage = {}
+                for chunk in stream:
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.delta.content:
+                            chunks.append(choice.delta.content)
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+                    if chunk.usage:
+                        usage = chunk.usage.model_dump()
+                content = "".join(chunks)
+                metadata = {"usage": usage, "finish_reason": finish_reason}
+
+            elif self.provider == "anthropic":
+                with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=4096,
+                    system=[{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }],
+                    messages=[{"role": "user", "content": user_prompt}],
+                    temperature=0.0
+                ) as stream:
+                    for text in stream.text_stream:
+                        chunks.append(text)
+                    final = stream.get_final_message()
+                content = "".join(chunks)
+                metadata = {
+                    "usage": {
+                        "input_tokens": final.usage.input_tokens if final.usage else 0,
+                        "output_tokens": final.usage.output_tokens if final.usage else 0
+                    },
+                    "stop_reason": final.stop_reason
+                }
+
+            is_valid, error, truncated = self._validate_response(content)
+
+            return LLMResponse(
+                content=content,
+                success=is_valid,
+                metadata=metadata,
+                truncated=truncated,
+                error=error
+            )
+
+        except Exception as e:
+            logger.error(f"Streaming API call failed: {e}")
+            return LLMResponse(
+                content="",
+                success=False,
+                error=str(e)
+            )
+
     def call(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         """Make LLM call with retry logic."""
         if not system_prompt or not user_prompt:
@@ -148,30 +396,48 @@ class LLMClient:
                 success=False,
                 error="System prompt and user prompt are required"
             )
-        
+
+        cache_key = self._response_cache_key(system_prompt, user_prompt)
+        with self._cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                cached = copy.deepcopy(cached)
+        if cached is not None:
+            logger.info("Response cache hit; skipping API call")
+            return cached
+
         last_error = None
-        
+        make_call = self._make_api_call_streaming if self.stream else self._make_api_call
+
         for attempt in range(self.max_retries):
             try:
-                response = self._make_api_call(system_prompt, user_prompt)
-                
+                response = make_call(system_prompt, user_prompt)
+
                 if response.success:
+                    # only successful responses are cached; errors retry
+                    with self._cache_lock:
+                        self._response_cache[cache_key] = copy.deepcopy(response)
+                        if len(self._response_cache) > self.RESPONSE_CACHE_MAX:
+                            self._response_cache.popitem(last=False)
                     return response
                     
                 # If truncated, try again with shorter prompt
                 if response.truncated and attempt < self.max_retries - 1:
                     logger.warning(f"Response truncated on attempt {attempt + 1}, retrying...")
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    time.sleep(self._retry_delay(attempt))
                     continue
-                    
+
                 last_error = response.error
-                
+                last_exc = None
+
             except Exception as e:
                 last_error = str(e)
+                last_exc = e
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                
+
             if attempt < self.max_retries - 1:
-                time.sleep(self.retry_delay * (attempt + 1))
+                time.sleep(self._retry_delay(attempt, last_exc))
         
         return LLMResponse(
             content="",
@@ -179,6 +445,18 @@ class LLMClient:
             error=f"Failed after {self.max_retries} attempts. Last error: {last_error}"
         )
 
+    def call_many(self, prompts, max_workers: int = 4) -> list:
+        """Issue independent (system_prompt, user_prompt) calls concurrently.
+
+        The work is network-bound, so a small thread pool compresses wall
+        time to roughly the slowest call; results come back in input order
+        and each call keeps its own retry logic and cache lookup.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda pair: self.call(*pair), prompts))
+
     def call_with_function(
         self,
         system_prompt: str,
@@ -188,7 +466,12 @@ class LLMClient:
         """Call LLM with function calling for guaranteed structured output."""
         if not function_schema:
             raise ValueError("Function schema is required")
-        
+
+        if not self.supports_function_calling:
+            # providers without function calling go straight to the
+            # JSON-structured-output path
+            return self.call_with_structured_output(system_prompt, user_prompt, function_schema.get("parameters", {}))
+
         try:
             if self.provider == "openai":
                 response = self.client.chat.completions.create(
@@ -204,7 +487,7 @@ class LLMClient:
                 
                 if response.choices[0].message.function_call:
                     try:
-                        function_args = json.loads(response.choices[0].message.function_call.arguments)
+                        function_args = jsonio.loads(response.choices[0].message.function_call.arguments)
                         function_args["success"] = True
                         return function_args
                     except json.JSONDecodeError as e:
@@ -212,10 +495,6 @@ class LLMClient:
                 else:
                     return {"error": "No function call in response", "success": False}
                     
-            elif self.provider == "anthropic":
-                # Anthropic doesn't support function calling in the same way, fallback to structured output
-                return self.call_with_structured_output(system_prompt, user_prompt, function_schema.get("parameters", {}))
-                
         except Exception as e:
             logger.error(f"Function call failed: {e}")
             return {"error": str(e), "success": False}
@@ -231,36 +510,76 @@ class LLMClient:
             raise ValueError("Output schema is required")
         
         # Add JSON formatting instructions
-        json_prompt = f"{user_prompt}\n\nRespond with valid JSON matching this schema: {json.dumps(output_schema)}"
+        json_prompt = f"{user_prompt}\n\nRespond with valid JSON matching this schema: {self._schema_json_for(output_schema)}"
         
         response = self.call(system_prompt, json_prompt)
         
         if not response.success:
             return {"error": response.error, "success": False}
         
+        content = response.content.strip()
         try:
-            # Try to extract JSON from response
-            content = response.content.strip()
-            
-            # Handle code blocks
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                if end != -1:
-                    content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end != -1:
-                    content = content[start:end].strip()
-            
-            parsed = json.loads(content)
-            parsed["success"] = True
-            return parsed
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            return {"error": f"Invalid JSON response: {str(e)}", "success": False}
+            # Fast path: the whole response is the JSON document
+            parsed = jsonio.loads(content)
+        except json.JSONDecodeError:
+            # Fenced/prose-wrapped responses: decode the first JSON object
+            # in place with raw_decode instead of scanning for code-fence
+            # markers and re-slicing the string
+            start = content.find("{")
+            if start == -1:
+                logger.error("No JSON object found in response")
+                return {"error": "Invalid JSON response: no object found", "success": False}
+            try:
+                parsed, _ = _JSON_DECODER.raw_decode(content, start)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON: {e}")
+                return {"error": f"Invalid JSON response: {str(e)}", "success": False}
+
+        if not isinstance(parsed, dict):
+            return {"error": "Invalid JSON response: expected an object", "success": False}
+        parsed["success"] = True
+        return parsed
+
+class AsyncLLMClient:
+    """Async facade over the composed LLMClient pipeline.
+
+    LLMClient already fuses the whole call path — shared SDK connection
+    pool, response cache, rate limiter, retry with jitter, optional
+    streaming — so this class does not duplicate any of it. It hands the
+    sync pipeline to a worker thread via asyncio.to_thread, letting
+    event-loop callers await calls (and fan them out with gather) without
+    blocking the loop or maintaining a second I/O stack.
+    """
+
+    def __init__(self, client: LLMClient):
+        self.client = client
+
+    async def call(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        return await asyncio.to_thread(self.client.call, system_prompt, user_prompt)
+
+    async def call_many(self, prompts) -> list:
+        """Await independent (system_prompt, user_prompt) calls concurrently."""
+        if not prompts:
+            return []
+        return list(await asyncio.gather(*(self.call(*pair) for pair in prompts)))
+
+    async def call_with_function(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        function_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self.client.call_with_function, system_prompt, user_prompt, function_schema)
+
+    async def call_with_structured_output(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        output_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self.client.call_with_structured_output, system_prompt, user_prompt, output_schema)
 
 class LLMUseCase:
     """Enum for different LLM use cases."""
@@ -271,49 +590,80 @@ class LLMUseCase:
 
 class LLMConfigManager:
     """Manages different LLM configurations for different use cases."""
-    
-    def __init__(self):
-        self.configs = {
-            LLMUseCase.PLANNING: {
-                "provider": "openai",
-                "model": "gpt-4",
-                "description": "Strategic planning and task orchestration"
-            },
-            LLMUseCase.CODE_GENERATION: {
-                "provider": "openai", 
-                "model": "gpt-4",
-                "description": "Code generation and implementation"
-            },
-            LLMUseCase.DEBUGGING: {
-                "provider": "anthropic",
-                "model": "claude-3-5-sonnet-20241022",
-                "description": "Problem analysis and debugging"
-            },
-            LLMUseCase.GENERAL: {
-                "provider": "openai",
-                "model": "gpt-4",
-                "description": "General purpose tasks"
-            }
+
+    # built once at class definition; instances copy from it lazily on
+    # first .configs access instead of rebuilding the literal per __init__
+    _DEFAULT_CONFIGS = {
+        LLMUseCase.PLANNING: {
+            "provider": "openai",
+            "model": "gpt-4",
+            "description": "Strategic planning and task orchestration"
+        },
+        LLMUseCase.CODE_GENERATION: {
+            "provider": "openai",
+            "model": "gpt-4",
+            "description": "Code generation and implementation"
+        },
+        LLMUseCase.DEBUGGING: {
+            "provider": "anthropic",
+            "model": "claude-3-5-sonnet-20241022",
+            "description": "Problem analysis and debugging"
+        },
+        LLMUseCase.GENERAL: {
+            "provider": "openai",
+            "model": "gpt-4",
+            "description": "General purpose tasks"
         }
+    }
+
+    def __init__(self):
+        # use cases sharing a (provider, model) get the same LLMClient,
+        # and with it the same response cache and rate limiter
+        self._client_cache: Dict[tuple, LLMClient] = {}
+        self._async_client_cache: Dict[tuple, AsyncLLMClient] = {}
+
+    @functools.cached_property
+    def configs(self) -> Dict[str, Dict[str, str]]:
+        """Per-instance use-case config table, materialized on first use.
+
+        Inner dicts are copied so set_config on one manager never leaks
+        into the class-level defaults or other instances.
+        """
+        return {use_case: dict(cfg) for use_case, cfg in self._DEFAULT_CONFIGS.items()}
 
     def get_client(self, use_case: str) -> LLMClient:
         """Get appropriate LLM client for use case."""
         if use_case not in self.configs:
             use_case = LLMUseCase.GENERAL
-        
+
         config = self.configs[use_case]
-        return LLMClient(
-            provider=config["provider"],
-            model=config["model"]
-        )
+        key = (config["provider"], config["model"])
+        client = self._client_cache.get(key)
+        if client is None:
+            client = LLMClient(provider=config["provider"], model=config["model"])
+            self._client_cache[key] = client
+        return client
+
+    def get_async_client(self, use_case: str) -> AsyncLLMClient:
+        """Get an async facade over the use case's (shared) client."""
+        client = self.get_client(use_case)
+        key = (client.provider, client.model)
+        async_client = self._async_client_cache.get(key)
+        if async_client is None:
+            async_client = AsyncLLMClient(client)
+            self._async_client_cache[key] = async_client
+        return async_client
 
     def set_config(self, use_case: str, provider: str, model: str, description: str = ""):
         """Update configuration for a use case."""
         if not use_case or not provider or not model:
             raise ValueError("Use case, provider, and model are required")
-        
+
         self.configs[use_case] = {
             "provider": provider,
-            "model": model, 
+            "model": model,
             "description": description
-        }
\ No newline at end of file
+        }
+        # no cache invalidation needed: clients are keyed by
+        # (provider, model), so the next get_client for this use case
+        # simply resolves to a different cache entry
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""JSON helpers that use orjson when available, stdlib json otherwise.
+
+LLM planning moves sizeable JSON payloads (schemas, plans, context blobs)
+on every call; orjson's Rust (de)serializer is several times faster than
+stdlib json for these. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so existing except clauses keep working either way.
+"""
+
+import json as _json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+JSONDecodeError = _json.JSONDecodeError
+
+if _orjson is not None:
+    def loads(s):
+        """Parse a JSON document from str or bytes."""
+        return _orjson.loads(s)
+
+    def dumps(obj, indent=False):
+        """Serialize obj to a JSON str (indent=True for 2-space pretty print)."""
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, option=option).decode()
+else:
+    def loads(s):
+        """Parse a JSON document from str or bytes."""
+        return _json.loads(s)
+
+    def dumps(obj, indent=False):
+        """Serialize obj to a JSON str (indent=True for 2-space pretty print)."""
+        return _json.dumps(obj, indent=2 if indent else None)
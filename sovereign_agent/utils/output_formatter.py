@@ -1,20 +1,47 @@
 """Clean, minimal output formatting for command results."""
 
+import io
+import os
 import re
+import sys
+from collections import deque
 from typing import Tuple
 
+# decided once at import: color (and the escaping that protects an
+# interactive terminal) only makes sense on a TTY, and the NO_COLOR
+# convention lets users force it off
+_COLOR_ENABLED = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
 class OutputFormatter:
     """Minimal output formatter inspired by mvp5 patterns."""
-    
-    # Color codes
-    GREEN = '\033[32m'
-    RED = '\033[31m'
-    CYAN = '\033[36m'
-    YELLOW = '\033[33m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    RESET = '\033[0m'
-    
+
+    # Color codes (empty strings when piped/CI, so formatted output is
+    # plain text with zero escape bytes)
+    GREEN = '\033[32m' if _COLOR_ENABLED else ''
+    RED = '\033[31m' if _COLOR_ENABLED else ''
+    CYAN = '\033[36m' if _COLOR_ENABLED else ''
+    YELLOW = '\033[33m' if _COLOR_ENABLED else ''
+    BOLD = '\033[1m' if _COLOR_ENABLED else ''
+    DIM = '\033[2m' if _COLOR_ENABLED else ''
+    RESET = '\033[0m' if _COLOR_ENABLED else ''
+
+    # compiled once: _escape_line runs per output line
+    _ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+    # one C-level translate pass: expands tabs to four spaces and deletes
+    # the other control characters below 0x20 except newline/CR
+    _CTRL_TBL = {c: None for c in range(32) if c not in (10, 13)}
+    _CTRL_TBL[9] = '    '
+
+    # whitespace-run collapser for command display
+    _WS_RE = re.compile(r'\s+')
+
+    # static fragments assembled once; format_command_result runs per
+    # command and these never change
+    _CMD_PREFIX = f"{CYAN}🔧 Command:{RESET} {BOLD}"
+    _STATUS_PREFIX = f"{CYAN}📊 Status:{RESET} "
+    _SUCCESS_STATUS = f"{GREEN}✅ SUCCESS{RESET}"
+
+
     @classmethod
     def format_command_result(cls, command: str, exit_code: int, stdout: str, stderr: str, max_lines: int = 50) -> str:
         """Format command execution result for clean display."""
@@ -24,16 +51,16 @@ class OutputFormatter:
         
         # Status indicator
         if exit_code == 0:
-            status = f"{cls.GREEN}✅ SUCCESS{cls.RESET}"
+            status = cls._SUCCESS_STATUS
         else:
             status = f"{cls.RED}❌ FAILED (exit code: {exit_code}){cls.RESET}"
-        
+
         # Clean command display
         clean_cmd = cls._clean_command(command)
-        
+
         result_parts = [
-            f"{cls.CYAN}🔧 Command:{cls.RESET} {cls.BOLD}{clean_cmd}{cls.RESET}",
-            f"{cls.CYAN}📊 Status:{cls.RESET} {status}"
+            cls._CMD_PREFIX + clean_cmd + cls.RESET,
+            cls._STATUS_PREFIX + status
         ]
         
         # Add stdout if present
@@ -51,8 +78,8 @@ class OutputFormatter:
     @classmethod
     def _clean_command(cls, command: str) -> str:
         """Clean up command for display."""
-        # Remove extra whitespace
-        command = ' '.join(command.split())
+        # Collapse whitespace runs in one C-level pass; no token list
+        command = cls._WS_RE.sub(' ', command).strip()
         # Don't truncate commands - show them in full for clarity
         # If very long (>200 chars), show on multiple lines for readability
         if len(command) > 200:
@@ -65,22 +92,40 @@ class OutputFormatter:
     
     @classmethod
     def _format_output(cls, output: str, label: str, color: str, max_lines: int) -> str:
-        """Format stdout/stderr output with truncation."""
-        lines = output.strip().split('\n')
-        
+        """Format stdout/stderr output with truncation.
+
+        Streams lines through StringIO instead of splitting the whole
+        output into a list, keeping only the displayed head, a small tail
+        window, and a counter — memory stays O(max_lines) however large
+        the command output is.
+        """
+        head_budget = max_lines - 5
+        head = []
+        # 5-line window: enough to hold every post-head line when the
+        # output fits, and the last 3 when it doesn't
+        tail = deque(maxlen=5)
+        total = 0
+        for raw in io.StringIO(output.strip()):
+            line = raw[:-1] if raw.endswith('\n') else raw
+            total += 1
+            if total <= head_budget:
+                head.append(line)
+            else:
+                tail.append(line)
+
         # Smart truncation based on output size
-        if len(lines) > max_lines:
+        if total > max_lines:
             # Show first portion and last few lines for context
-            first_chunk = lines[:max_lines - 5]
-            last_chunk = lines[-3:]
-            truncated_count = len(lines) - max_lines + 2
-            
-            displayed_lines = first_chunk + [
+            last_chunk = list(tail)[-3:]
+            truncated_count = total - max_lines + 2
+
+            lines = head + [
                 f"{cls.DIM}",
                 f"... ({truncated_count} more lines) ...",
                 f"[Last few lines shown below]{cls.RESET}"
             ] + last_chunk
-            lines = displayed_lines
+        else:
+            lines = head + list(tail)
         
         # Format each line with proper indentation
         formatted_lines = [f"{cls.CYAN}{label}:{cls.RESET}"]
@@ -101,13 +146,13 @@ class OutputFormatter:
     @classmethod
     def _escape_line(cls, line: str) -> str:
         """Escape special characters for safe terminal display."""
-        # Remove ANSI color codes if present
-        line = re.sub(r'\x1b\[[0-9;]*m', '', line)
-        # Replace tabs with spaces
-        line = line.replace('\t', '    ')
-        # Remove any control characters except newlines
-        line = ''.join(char for char in line if ord(char) >= 32 or char in '\n\r')
-        return line
+        if not _COLOR_ENABLED:
+            # piped/CI output: consumers want the bytes untouched, and
+            # there is no terminal to protect from control sequences
+            return line
+        # strip ANSI color codes, then expand tabs and drop remaining
+        # control characters in one pass over the precomputed table
+        return cls._ANSI_RE.sub('', line).translate(cls._CTRL_TBL)
     
     @classmethod
     def format_step_header(cls, step_num: int, total_steps: int, step_goal: str, handler_name: str) -> str:
@@ -9,82 +9,111 @@ class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
+# The require_* checks live at module level so hot callers bind them
+# directly (no Validator. attribute lookup per call); error messages are
+# only built on the failure branch. The Validator class below keeps the
+# original namespace working.
+
+def require_not_none(value: Any, name: str) -> Any:
+    """Require value is not None."""
+    if value is None:
+        raise ValidationError(f"{name} cannot be None")
+    return value
+
+def require_not_empty_string(value: str, name: str) -> str:
+    """Require string is not None or empty."""
+    if not value or not isinstance(value, str) or not value.strip():
+        raise ValidationError(f"{name} must be a non-empty string")
+    return value.strip()
+
+def require_type(value: Any, expected_type: type, name: str) -> Any:
+    """Require value is of expected type."""
+    if not isinstance(value, expected_type):
+        raise ValidationError(f"{name} must be of type {expected_type.__name__}, got {type(value).__name__}")
+    return value
+
+def require_dict(value: Any, name: str) -> Dict[str, Any]:
+    """Require value is a dictionary."""
+    if not isinstance(value, dict):
+        raise ValidationError(f"{name} must be a dictionary, got {type(value).__name__}")
+    return value
+
+def require_list(value: Any, name: str) -> List[Any]:
+    """Require value is a list."""
+    if not isinstance(value, list):
+        raise ValidationError(f"{name} must be a list, got {type(value).__name__}")
+    return value
+
+def require_non_empty_list(value: Any, name: str) -> List[Any]:
+    """Require value is a non-empty list."""
+    if not isinstance(value, list):
+        raise ValidationError(f"{name} must be a list, got {type(value).__name__}")
+    if len(value) == 0:
+        raise ValidationError(f"{name} cannot be empty")
+    return value
+
+def require_range(value: Union[int, float], min_val: Union[int, float], max_val: Union[int, float], name: str) -> Union[int, float]:
+    """Require numeric value is within range."""
+    if not isinstance(value, (int, float)):
+        raise ValidationError(f"{name} must be a number, got {type(value).__name__}")
+    if value < min_val or value > max_val:
+        raise ValidationError(f"{name} must be between {min_val} and {max_val}, got {value}")
+    return value
+
+def require_one_of(value: Any, allowed_values: List[Any], name: str) -> Any:
+    """Require value is one of allowed values."""
+    if value not in allowed_values:
+        raise ValidationError(f"{name} must be one of {allowed_values}, got {value}")
+    return value
+
+def require_has_attribute(obj: Any, attr_name: str, obj_name: str = "object") -> Any:
+    """Require object has specified attribute."""
+    if not hasattr(obj, attr_name):
+        raise ValidationError(f"{obj_name} must have attribute '{attr_name}'")
+    return obj
+
+def require_callable(value: Any, name: str) -> Callable:
+    """Require value is callable."""
+    if not callable(value):
+        raise ValidationError(f"{name} must be callable")
+    return value
+
 class Validator:
-    """Comprehensive validation utilities."""
-    
-    @staticmethod
-    def require_not_none(value: Any, name: str) -> Any:
-        """Require value is not None."""
-        if value is None:
-            raise ValidationError(f"{name} cannot be None")
-        return value
-    
-    @staticmethod
-    def require_not_empty_string(value: str, name: str) -> str:
-        """Require string is not None or empty."""
-        if not value or not isinstance(value, str) or not value.strip():
-            raise ValidationError(f"{name} must be a non-empty string")
-        return value.strip()
-    
-    @staticmethod
-    def require_type(value: Any, expected_type: type, name: str) -> Any:
-        """Require value is of expected type."""
-        if not isinstance(value, expected_type):
-            raise ValidationError(f"{name} must be of type {expected_type.__name__}, got {type(value).__name__}")
-        return value
-    
-    @staticmethod
-    def require_dict(value: Any, name: str) -> Dict[str, Any]:
-        """Require value is a dictionary."""
-        if not isinstance(value, dict):
-            raise ValidationError(f"{name} must be a dictionary, got {type(value).__name__}")
-        return value
-    
-    @staticmethod
-    def require_list(value: Any, name: str) -> List[Any]:
-        """Require value is a list."""
-        if not isinstance(value, list):
-            raise ValidationError(f"{name} must be a list, got {type(value).__name__}")
-        return value
-    
-    @staticmethod
-    def require_non_empty_list(value: Any, name: str) -> List[Any]:
-        """Require value is a non-empty list."""
-        if not isinstance(value, list):
-            raise ValidationError(f"{name} must be a list, got {type(value).__name__}")
-        if len(value) == 0:
-            raise ValidationError(f"{name} cannot be empty")
-        return value
-    
-    @staticmethod
-    def require_range(value: Union[int, float], min_val: Union[int, float], max_val: Union[int, float], name: str) -> Union[int, float]:
-        """Require numeric value is within range."""
-        if not isinstance(value, (int, float)):
-            raise ValidationError(f"{name} must be a number, got {type(value).__name__}")
-        if value < min_val or value > max_val:
-            raise ValidationError(f"{name} must be between {min_val} and {max_val}, got {value}")
-        return value
-    
-    @staticmethod
-    def require_one_of(value: Any, allowed_values: List[Any], name: str) -> Any:
-        """Require value is one of allowed values."""
-        if value not in allowed_values:
-            raise ValidationError(f"{name} must be one of {allowed_values}, got {value}")
-        return value
-    
-    @staticmethod
-    def require_has_attribute(obj: Any, attr_name: str, obj_name: str = "object") -> Any:
-        """Require object has specified attribute."""
-        if not hasattr(obj, attr_name):
-            raise ValidationError(f"{obj_name} must have attribute '{attr_name}'")
-        return obj
-    
-    @staticmethod
-    def require_callable(value: Any, name: str) -> Callable:
-        """Require value is callable."""
-        if not callable(value):
-            raise ValidationError(f"{name} must be callable")
-        return value
+    """Comprehensive validation utilities (namespace over the module functions)."""
+
+    require_not_none = staticmethod(require_not_none)
+    require_not_empty_string = staticmethod(require_not_empty_string)
+    require_type = staticmethod(require_type)
+    require_dict = staticmethod(require_dict)
+    require_list = staticmethod(require_list)
+    require_non_empty_list = staticmethod(require_non_empty_list)
+    require_range = staticmethod(require_range)
+    require_one_of = staticmethod(require_one_of)
+    require_has_attribute = staticmethod(require_has_attribute)
+    require_callable = staticmethod(require_callable)
+
+def build_validator(schema: Dict[str, Optional[type]]) -> Callable[..., Dict[str, Any]]:
+    """Build a reusable one-pass checker for a dict shape.
+
+    schema maps required key -> expected type (None for presence-only).
+    Build the checker once per shape and reuse it: the returned closure
+    verifies presence and types in a single traversal, replacing a chain
+    of individual require_* calls and their per-call overhead.
+    """
+    checks = tuple(schema.items())
+
+    def validate(data: Any, name: str = "data") -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValidationError(f"{name} must be a dictionary, got {type(data).__name__}")
+        for key, expected_type in checks:
+            if key not in data:
+                raise ValidationError(f"{name} missing required key: {key}")
+            if expected_type is not None and not isinstance(data[key], expected_type):
+                raise ValidationError(
+                    f"{name}[{key}] must be of type {expected_type.__name__}, got {type(data[key]).__name__}")
+        return data
+
+    return validate
 
 def safe_get_attribute(obj: Any, attr_name: str, default: Any = None) -> Any:
     """Safely get attribute from object with default."""
@@ -99,28 +128,28 @@ def safe_dict_get(d: Dict[str, Any], key: str, default: Any = None) -> Any:
     if not isinstance(d, dict):
         logger.warning(f"Expected dictionary, got {type(d).__name__}")
         return default
-    
+
     return d.get(key, default)
 
 def validate_json_structure(data: Dict[str, Any], required_keys: List[str], name: str = "JSON") -> Dict[str, Any]:
     """Validate JSON structure has required keys."""
     if not isinstance(data, dict):
         raise ValidationError(f"{name} must be a dictionary")
-    
+
     missing_keys = [key for key in required_keys if key not in data]
     if missing_keys:
         raise ValidationError(f"{name} missing required keys: {missing_keys}")
-    
+
     return data
 
 def clean_string(value: Any) -> str:
     """Clean and normalize string value."""
     if value is None:
         return ""
-    
+
     if not isinstance(value, str):
         value = str(value)
-    
+
     return value.strip()
 
 def safe_int_conversion(value: Any, default: int = 0) -> int:
@@ -137,4 +166,4 @@ def safe_float_conversion(value: Any, default: float = 0.0) -> float:
         return float(value)
     except (ValueError, TypeError):
         logger.warning(f"Failed to convert '{value}' to float, using default {default}")
-        return default
\ No newline at end of file
+        return default
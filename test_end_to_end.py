@@ -1,244 +1,275 @@
 #!/usr/bin/env python3
 """
-End-to-end test of the Sovereign Agent without actual LLM API calls.
+End-to-end tests of the Sovereign Agent without actual LLM API calls.
 """
 
+import logging
+import re
 import sys
 import os
 import tempfile
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
+logger = logging.getLogger(__name__)
+
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# One import pass per module instead of one per test function; the
+# pydantic-backed model modules are the heavy part of this graph
+from sovereign_agent.agent import SovereignAgent, discover_handlers
+from sovereign_agent.core.cognitive_core import CognitiveCore, IntelligentLLM
+from sovereign_agent.core.models import AgentResponse, HandlerStepModel, TaskPlan
+from sovereign_agent.core.state import SharedSessionState
+from sovereign_agent.handlers.tooling_handler import ToolingHandler
+from sovereign_agent.integrations.llm_client import (
+    LLMClient,
+    LLMConfigManager,
+    LLMResponse,
+    LLMUseCase,
+)
+from sovereign_agent.utils.validation import ValidationError, Validator
+
+
+# Plan shapes for the validation grid, built once at module scope
+VALID_PLAN = {
+    "overall_goal": "Test goal",
+    "steps": [
+        {
+            "handler_name": "ToolingHandler",
+            "step_goal": "Test step",
+            "input_args": {"command": "ls"}
+        }
+    ]
+}
+MISSING_STEPS_PLAN = {"overall_goal": "Test goal"}
+EMPTY_PLAN = {}
+MISSING_HANDLER_PLAN = {
+    "overall_goal": "Test goal",
+    "steps": [{"step_goal": "Test step", "input_args": {}}]
+}
+
+# compiled once at module scope; the content assertions below reuse them
+_SHELL_RE = re.compile(r"shell commands")
+_STEPS_RE = re.compile(r"\bsteps\b")
+_GOAL_RE = re.compile(r"\boverall_goal\b")
+_HANDLER_RE = re.compile(r"\bhandler_name\b")
+
+
+# Expensive objects are built once per run and shared: every test used to
+# re-import the same submodules and re-instantiate these.
+
+@pytest.fixture(scope="session")
+def tooling_handler():
+    return ToolingHandler()
+
+@pytest.fixture(scope="session")
+def intelligent_llm():
+    return IntelligentLLM()
+
+@pytest.fixture(scope="session")
+def config_manager():
+    return LLMConfigManager()
+
+@pytest.fixture(scope="session")
+def discovered_handlers():
+    return discover_handlers()
+
+
 def test_models():
     """Test all Pydantic models can be instantiated and validated."""
-    print("🧪 Testing models...")
-    
-    from sovereign_agent.core.models import AgentResponse, HandlerStepModel, TaskPlan
-    
-    # Test AgentResponse
-    response = AgentResponse(success=True, content="Test content")
-    assert response.success == True
-    assert response.content == "Test content"
-    assert response.status_update == ""
-    assert response.artifacts_created == {}
-    
-    # Test HandlerStepModel
-    step = HandlerStepModel(
+    logger.debug("Testing models...")
+
+    # Assertion-only objects are built from trusted literals, so
+    # model_construct skips the pydantic-core validation pass
+    response = AgentResponse.model_construct(
+        success=True, content="Test content", status_update="", artifacts_created={}
+    )
+    # one model_dump + dict equality per object instead of a field-access
+    # chain per assertion
+    assert response.model_dump() == {
+        "success": True,
+        "content": "Test content",
+        "status_update": "",
+        "artifacts_created": {},
+        "state_updates": {},
+    }
+
+    # Test HandlerStepModel (id is a random uuid, so it stays excluded)
+    step = HandlerStepModel.model_construct(
         handler_name="TestHandler",
         step_goal="Test goal",
         input_args={"key": "value"}
     )
-    assert step.handler_name == "TestHandler"
-    assert step.step_goal == "Test goal"
-    assert step.status == "pending"
-    assert step.input_args == {"key": "value"}
-    
+    step_dump = step.model_dump(exclude={"id"})
+    assert step_dump == {
+        "handler_name": "TestHandler",
+        "step_goal": "Test goal",
+        "input_args": {"key": "value"},
+        "status": "pending",
+        "result": None,
+    }
+
     # Test TaskPlan
-    plan = TaskPlan(
+    plan = TaskPlan.model_construct(
         overall_goal="Test plan",
         steps=[step],
         confidence=0.8,
         reasoning="Test reasoning"
     )
-    assert plan.overall_goal == "Test plan"
+    assert plan.model_dump(exclude={"plan_id", "steps"}) == {
+        "overall_goal": "Test plan",
+        "confidence": 0.8,
+        "reasoning": "Test reasoning",
+    }
     assert len(plan.steps) == 1
-    assert plan.confidence == 0.8
-    
-    print("✅ Models test passed")
+    assert plan.steps[0].model_dump(exclude={"id"}) == step_dump
 
-def test_handlers():
+    # One full-constructor case so the validators still get exercised:
+    # the mode='before' validator turns None content into ''
+    validated = AgentResponse(success=True, content=None)
+    assert validated.content == ""
+
+    logger.debug("Models test passed")
+
+def test_handlers(tooling_handler, workspace_path):
     """Test handlers can be instantiated and basic validation works."""
-    print("🧪 Testing handlers...")
-    
-    from sovereign_agent.handlers.tooling_handler import ToolingHandler
-    from sovereign_agent.core.state import SharedSessionState
-    from sovereign_agent.core.models import AgentResponse
-    
-    # Create test workspace
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace_path = Path(tmpdir)
-        
-        # Test handler instantiation
-        handler = ToolingHandler()
-        assert handler.name == "ToolingHandler"
-        assert "shell commands" in handler.description
-        
-        # Test capabilities
-        capabilities = handler.get_capabilities()
-        assert capabilities["name"] == "ToolingHandler"
-        assert "description" in capabilities
-        
-        # Test state creation
-        state = SharedSessionState(workspace_path)
-        assert state.workspace_context.path == workspace_path
-        assert isinstance(state.conversation_history, list)
-    
-    print("✅ Handlers test passed")
-
-def test_llm_client():
+    logger.debug("Testing handlers...")
+
+    # Test handler instantiation
+    assert tooling_handler.name == "ToolingHandler"
+    assert _SHELL_RE.search(tooling_handler.description)
+
+    # Test capabilities
+    capabilities = tooling_handler.get_capabilities()
+    assert capabilities["name"] == "ToolingHandler"
+    assert "description" in capabilities
+    # lock in the caching contract: one dict per handler, not per call
+    assert tooling_handler.get_capabilities() is capabilities
+
+    # Test state creation
+    state = SharedSessionState(workspace_path)
+    assert state.workspace_context.path == workspace_path
+    assert isinstance(state.conversation_history, deque)
+    state.add_to_history("user", "hello")
+    assert state.recent(5) == [{"role": "user", "content": "hello"}]
+
+    logger.debug("Handlers test passed")
+
+def test_llm_client(config_manager):
     """Test LLM client structure without API calls."""
-    print("🧪 Testing LLM client...")
-    
-    from sovereign_agent.integrations.llm_client import LLMConfigManager, LLMUseCase
-    
-    # Test config manager
-    config_manager = LLMConfigManager()
-    
+    logger.debug("Testing LLM client...")
+
     # Test different use cases are configured
     assert LLMUseCase.PLANNING in config_manager.configs
     assert LLMUseCase.CODE_GENERATION in config_manager.configs
     assert LLMUseCase.DEBUGGING in config_manager.configs
-    
+
     # Test config structure
     planning_config = config_manager.configs[LLMUseCase.PLANNING]
     assert "provider" in planning_config
     assert "model" in planning_config
     assert "description" in planning_config
-    
-    print("✅ LLM client test passed")
 
-def test_cognitive_core():
-    """Test cognitive core can be instantiated and basic functionality works."""
-    print("🧪 Testing cognitive core...")
-    
-    from sovereign_agent.core.cognitive_core import CognitiveCore, IntelligentLLM
-    from sovereign_agent.handlers.tooling_handler import ToolingHandler
-    from sovereign_agent.core.state import SharedSessionState
-    from sovereign_agent.integrations.llm_client import LLMResponse
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace_path = Path(tmpdir)
-        
-        # Create handlers
-        handlers = [ToolingHandler()]
-        
-        # Test IntelligentLLM structure
-        intelligent_llm = IntelligentLLM()
-        assert hasattr(intelligent_llm, 'config_manager')
-        assert hasattr(intelligent_llm, '_validate_plan_structure')
-        
-        # Test plan validation
-        valid_plan = {
-            "overall_goal": "Test goal",
-            "steps": [
-                {
-                    "handler_name": "ToolingHandler",
-                    "step_goal": "Test step",
-                    "input_args": {"command": "ls"}
-                }
-            ]
-        }
-        is_valid, error = intelligent_llm._validate_plan_structure(valid_plan)
-        assert is_valid == True
+    logger.debug("LLM client test passed")
+
+@pytest.mark.parametrize("plan,expected_valid,expected_pattern", [
+    (VALID_PLAN, True, None),
+    (MISSING_STEPS_PLAN, False, _STEPS_RE),
+    (EMPTY_PLAN, False, _GOAL_RE),
+    (MISSING_HANDLER_PLAN, False, _HANDLER_RE),
+])
+def test_plan_validation(intelligent_llm, plan, expected_valid, expected_pattern):
+    """Test structural plan validation across plan shapes."""
+    is_valid, error = intelligent_llm._validate_plan_structure(plan)
+    assert is_valid == expected_valid
+    if expected_pattern is None:
         assert error is None
-        
-        # Test invalid plan
-        invalid_plan = {"overall_goal": "Test goal"}  # Missing steps
-        is_valid, error = intelligent_llm._validate_plan_structure(invalid_plan)
-        assert is_valid == False
-        assert "steps" in error
-        
-        # Test CognitiveCore instantiation
-        try:
-            core = CognitiveCore(handlers)
-            assert hasattr(core, 'handler_capabilities')
-            assert hasattr(core, 'llm')
-            assert len(core.handler_capabilities) == 1
-            assert "ToolingHandler" in core.handler_capabilities
-        except Exception as e:
-            # Expected if LLM API keys are not set
-            print(f"ℹ️  CognitiveCore initialization failed (expected without API keys): {e}")
-    
-    print("✅ Cognitive core test passed")
-
-def test_agent_integration():
-    """Test agent can be instantiated and basic flow works.""" 
-    print("🧪 Testing agent integration...")
-    
-    from sovereign_agent.agent import SovereignAgent, discover_handlers
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace_path = str(tmpdir)
-        
-        # Test handler discovery
-        handlers = discover_handlers()
-        assert len(handlers) > 0
-        assert "ToolingHandler" in handlers
-        
-        # Test agent instantiation
-        try:
-            agent = SovereignAgent(workspace_path)
-            assert agent.workspace_path.exists()
-            assert hasattr(agent, 'handlers')
-            assert hasattr(agent, 'cognitive_core')
-            assert hasattr(agent, 'state')
-        except Exception as e:
-            # Expected if LLM API keys are not set
-            print(f"ℹ️  Agent initialization failed (expected without API keys): {e}")
-    
-    print("✅ Agent integration test passed")
+    else:
+        assert expected_pattern.search(error)
+
+def test_cognitive_core(intelligent_llm, tooling_handler, workspace_path):
+    """Test cognitive core can be instantiated and basic functionality works."""
+    logger.debug("Testing cognitive core...")
+
+    # Test IntelligentLLM structure
+    missing = {a for a in ('config_manager', '_validate_plan_structure')
+               if not hasattr(intelligent_llm, a)}
+    assert not missing, missing
+
+    # Test CognitiveCore instantiation
+    core = CognitiveCore([tooling_handler])
+    missing = {a for a in ('handler_capabilities', 'llm') if not hasattr(core, a)}
+    assert not missing, missing
+    assert len(core.handler_capabilities) == 1
+    assert "ToolingHandler" in core.handler_capabilities
+
+    # Test orchestration with the LLM patched at the call boundary, so
+    # the full plan-construction path runs without a network round-trip
+    canned_plan = {
+        "overall_goal": "Summarize the project",
+        "steps": [
+            {
+                "handler_name": "ToolingHandler",
+                "step_goal": "List project files",
+                "input_args": {"command": "ls"}
+            }
+        ],
+        "success": True
+    }
+    state = SharedSessionState(workspace_path)
+    with patch.object(LLMClient, "call_with_function", return_value=canned_plan):
+        plan = core.orchestrate("summarize what this project does", state)
+    assert plan is not None
+    assert plan.overall_goal == "Summarize the project"
+    assert len(plan.steps) == 1
+    assert plan.steps[0].handler_name == "ToolingHandler"
+    assert plan.steps[0].input_args == {"command": "ls"}
+
+    logger.debug("Cognitive core test passed")
+
+def test_agent_integration(workspace_path, discovered_handlers):
+    """Test agent can be instantiated and basic flow works."""
+    logger.debug("Testing agent integration...")
+
+    # Test handler discovery
+    assert len(discovered_handlers) > 0
+    assert "ToolingHandler" in discovered_handlers
+    # discovery is memoized process-wide; the agent reuses this registry
+    assert discover_handlers() is discovered_handlers
+
+    # Test agent instantiation
+    agent = SovereignAgent(str(workspace_path))
+    assert agent.workspace_path.exists()
+    missing = {a for a in ('handlers', 'cognitive_core', 'state') if not hasattr(agent, a)}
+    assert not missing, missing
+
+    logger.debug("Agent integration test passed")
 
 def test_validation_utilities():
     """Test validation utilities work correctly."""
-    print("🧪 Testing validation utilities...")
-    
-    from sovereign_agent.utils.validation import Validator, ValidationError
-    
+    logger.debug("Testing validation utilities...")
+
     # Test require_not_none
-    try:
+    with pytest.raises(ValidationError, match="test"):
         Validator.require_not_none(None, "test")
-        assert False, "Should have raised ValidationError"
-    except ValidationError as e:
-        assert "test" in str(e)
-    
+
     # Test require_not_empty_string
     result = Validator.require_not_empty_string("  hello  ", "test")
     assert result == "hello"
-    
-    try:
+
+    with pytest.raises(ValidationError, match="test"):
         Validator.require_not_empty_string("", "test")
-        assert False, "Should have raised ValidationError"
-    except ValidationError:
-        pass
-    
+
     # Test require_type
     result = Validator.require_type([1, 2, 3], list, "test")
     assert result == [1, 2, 3]
-    
-    try:
+
+    with pytest.raises(ValidationError, match="test"):
         Validator.require_type("not a list", list, "test")
-        assert False, "Should have raised ValidationError"  
-    except ValidationError:
-        pass
-    
-    print("✅ Validation utilities test passed")
-
-def main():
-    """Run all end-to-end tests."""
-    print("🚀 Starting end-to-end tests...\n")
-    
-    try:
-        test_models()
-        test_handlers()
-        test_llm_client()
-        test_cognitive_core()
-        test_agent_integration()
-        test_validation_utilities()
-        
-        print(f"\n🎉 All tests passed! The Sovereign Agent system is working correctly.")
-        print("ℹ️  Note: LLM API calls are not tested (requires API keys)")
-        print("ℹ️  To test with real LLM calls, set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variables")
-        
-        return 0
-        
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+
+    logger.debug("Validation utilities test passed")